@@ -0,0 +1,62 @@
+# benchmarks/poster_decode.py
+"""
+Decode + resize time per poster card, before (full decode) and after
+(reduced-scale JPEG decode) for each resample policy. The disk thumbnail
+cache is bypassed, so this is the cold-cache cost of one card.
+
+    python benchmarks/poster_decode.py [poster folder] [--repeat N]
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image
+
+from thumbcache import RESAMPLE_POLICIES, decode_poster
+
+# Sizes the app shows posters at: grid cards and the details window
+SIZES = [(160, 250), (330, 480)]
+
+
+def full_decode(path, size):
+    """The old path: decode at full resolution, then resize."""
+    return Image.open(path).convert("RGB").resize(size)
+
+
+def time_per_card(fn, paths, size, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for p in paths:
+            fn(p, size)
+        best = min(best, time.perf_counter() - start)
+    return best / len(paths) * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("folder", nargs="?", default=".")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    paths = sorted(p for p in glob.glob(os.path.join(args.folder, "*.jpg"))
+                   if os.path.basename(p) not in ("bgimage.jpg", "logo.jpg", "profile.jpg"))
+    if not paths:
+        print("No posters found in", args.folder)
+        return 1
+    print(f"{len(paths)} posters, best of {args.repeat} runs, ms per card")
+    print(f"{'size':>9}  {'full decode':>11}" + "".join(f"  {name:>9}" for name in RESAMPLE_POLICIES))
+    for size in SIZES:
+        before = time_per_card(full_decode, paths, size, args.repeat)
+        after = [time_per_card(lambda p, s, n=name: decode_poster(p, s, n), paths, size, args.repeat)
+                 for name in RESAMPLE_POLICIES]
+        print(f"{size[0]:>4}x{size[1]:<4}  {before:>11.2f}" + "".join(f"  {t:>9.2f}" for t in after))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
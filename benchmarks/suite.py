@@ -0,0 +1,247 @@
+# benchmarks/suite.py
+"""
+End-to-end benchmark suite on synthetic catalogs: load, normalization, search,
+type filtering, poster decode + resize and watchlist persistence, at one or
+more catalog sizes. Results go to a JSON file so runs can be compared.
+
+    python benchmarks/suite.py [--items 10000 100000] [--out FILE] [--compare OLD.json]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from catalog import fold, iter_catalog, normalize_item
+from facets import FacetIndex
+from journal import Journal
+from search_index import FuzzyIndex, NgramIndex, QueryCache
+from thumbcache import decode_poster
+
+from poster_decode import full_decode
+from synthetic import POSTER_SIZE, generate_catalog, generate_posters
+
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+
+
+def best_of(fn, repeat):
+    """Fastest of `repeat` runs of fn(), in ms (the minimum is the least noisy)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def typing(query):
+    """Prefixes the search box sees while `query` is typed ("gul", "gull", ...)."""
+    return [query[:k] for k in range(1, len(query) + 1)]
+
+
+# ----------------- Benchmarks -----------------
+def bench_load(path, repeat):
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    parse = best_of(lambda: json.loads(text), repeat)
+    # normalize_item consumes its dict, so each run parses afresh; the parse time is taken off
+    parse_and_normalize = best_of(lambda: [normalize_item(d) for d in json.loads(text)], repeat)
+    return {
+        "load.json_loads": parse,
+        "load.iter_catalog": best_of(lambda: list(iter_catalog(path)), repeat),   # what the app does
+        "normalize": max(parse_and_normalize - parse, 0.0),
+    }
+
+
+def bench_search(items, queries, repeat):
+    """on_search_change semantics: one cached n-gram lookup per keystroke, then the result list."""
+    index = NgramIndex()
+    fuzzy = FuzzyIndex()
+    start = time.perf_counter()
+    for i, item in enumerate(items):
+        index.add(i, item.title_key)
+    build = (time.perf_counter() - start) * 1000
+    for i, item in enumerate(items):
+        fuzzy.add(i, item.title_key)
+
+    def type_queries():
+        cache = QueryCache(index)
+        for query in queries:
+            for prefix in typing(query):
+                ids = cache.search(prefix)
+                [items[i] for i in ids]
+
+    def scan():
+        # the old per-keystroke scan, for reference
+        for query in queries:
+            for prefix in typing(query):
+                key = fold(prefix)
+                [m for m in items if key in m.title_key]
+
+    keystrokes = sum(len(q) for q in queries)
+    return {
+        "search.index_build": build,
+        "search.per_keystroke": best_of(type_queries, repeat) / keystrokes,
+        "search.scan_per_keystroke": best_of(scan, repeat) / keystrokes,
+        "search.fuzzy_per_query": best_of(lambda: [fuzzy.search(q) for q in queries], repeat) / len(queries),
+    }
+
+
+def bench_filter(items, repeat):
+    """Facet index built as data1 builds it (bulk add, then one flush), then _view_items' lookups."""
+    def build():
+        index = FacetIndex()
+        index.add_many(enumerate(items))
+        index.flush()
+        return index
+
+    facets = build()
+    results = {
+        "filter.index_build": best_of(build, repeat),
+        "filter.type_facets": best_of(lambda: [items[i] for i in facets.select(type="movie")], repeat),
+        "filter.type_scan": best_of(lambda: [m for m in items if m.type == "movie"], repeat),
+        "filter.facets_combined": best_of(
+            lambda: facets.filter(type="series", genre="Drama", language="Hindi"), repeat),
+    }
+    try:
+        from columnar import HAVE_NUMPY, ColumnarCatalog
+        if HAVE_NUMPY:
+            columns = ColumnarCatalog(items)
+            results["filter.type_columnar"] = best_of(
+                lambda: [items[i] for i in columns.ids(columns.mask(type="movie"))], repeat)
+    except Exception as e:
+        print("Skipping columnar filter:", e)
+    return results
+
+
+def bench_posters(paths, repeat, size=(160, 250)):
+    return {
+        "poster.full_decode_per_card": best_of(lambda: [full_decode(p, size) for p in paths], repeat) / len(paths),
+        "poster.decode_per_card": best_of(lambda: [decode_poster(p, size) for p in paths], repeat) / len(paths),
+    }
+
+
+def bench_persistence(items, folder, clicks=200):
+    """A watchlist of len(items) entries: per-click cost of the journal vs re-dumping movies.json."""
+    movies = [{"title": m.title, "category": m.type, "watched": False} for m in items]
+    path = os.path.join(folder, "movies.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(movies, f, indent=2)
+
+    def dump_per_click():
+        # the old save_movies(): whole list, every click
+        for i in range(clicks):
+            movies[i]["watched"] = True
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(movies, f, indent=2)
+
+    journal = Journal(path, threshold=float("inf"))   # no compaction mid-run
+    journal.load()
+
+    def journal_per_click():
+        for i in range(clicks):
+            journal.append({"op": "watched", "index": i})
+
+    return {
+        "persist.dump_per_click": best_of(dump_per_click, 1) / clicks,
+        "persist.journal_per_click": best_of(journal_per_click, 1) / clicks,
+        "persist.compact": best_of(lambda: journal.compact(movies), 1),
+    }
+
+
+# ----------------- Runner -----------------
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+def run(sizes, work, repeat, posters, persist_items):
+    poster_paths = generate_posters(os.path.join(work, "posters"), posters)
+    rng = random.Random(1)
+    runs = []
+    for n in sizes:
+        print(f"-- {n} items")
+        path = generate_catalog(os.path.join(work, f"data_{n}.json"), n, poster_paths)
+        items = list(iter_catalog(path))
+        queries = [rng.choice(items).title.split()[0][:6] for _ in range(10)]
+        results = {}
+        results.update(bench_load(path, repeat))
+        results.update(bench_search(items, queries, repeat))
+        results.update(bench_filter(items, repeat))
+        results.update(bench_persistence(items[:persist_items], work))
+        for name, ms in results.items():
+            print(f"  {name:<32} {ms:>10.3f} ms")
+        runs.append({"items": n, "file_bytes": os.path.getsize(path), "results_ms": results})
+
+    print(f"-- {posters} posters at {POSTER_SIZE[0]}x{POSTER_SIZE[1]}")
+    poster_results = bench_posters(poster_paths, repeat)
+    for name, ms in poster_results.items():
+        print(f"  {name:<32} {ms:>10.3f} ms")
+    return runs, poster_results
+
+
+def compare(old_path, report):
+    """Print each timing next to the same timing in an earlier report."""
+    with open(old_path, "r", encoding="utf-8") as f:
+        old = json.load(f)
+    old_runs = {r["items"]: r["results_ms"] for r in old.get("runs", [])}
+    print(f"-- compared with {old_path} ({old.get('commit')})")
+    rows = [("posters", report["posters_ms"], old.get("posters_ms", {}))]
+    rows += [(f"{r['items']} items", r["results_ms"], old_runs.get(r["items"], {})) for r in report["runs"]]
+    for label, new, before in rows:
+        for name, ms in new.items():
+            if name in before and before[name] > 0:
+                print(f"  {label:<14} {name:<32} {before[name]:>10.3f} -> {ms:>10.3f} ms  "
+                      f"({(ms / before[name] - 1) * 100:+.0f}%)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--posters", type=int, default=40)
+    parser.add_argument("--persist-items", type=int, default=2000, help="watchlist size for the persistence run")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--work", help="folder for the generated data (default: a temp folder, removed after)")
+    parser.add_argument("--out", help="results file (default: benchmarks/results/<time>.json)")
+    parser.add_argument("--compare", help="earlier results file to print deltas against")
+    args = parser.parse_args(argv)
+
+    work = args.work or tempfile.mkdtemp(prefix="moviemax-bench-")
+    try:
+        runs, poster_results = run(args.items, work, args.repeat, args.posters, args.persist_items)
+    finally:
+        if not args.work:
+            shutil.rmtree(work, ignore_errors=True)
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "runs": runs,
+        "posters_ms": poster_results,
+    }
+    out = args.out or os.path.join(RESULTS_DIR, time.strftime("%Y%m%d-%H%M%S") + ".json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print("Results written to", out)
+    if args.compare:
+        compare(args.compare, report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
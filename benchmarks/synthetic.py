@@ -0,0 +1,136 @@
+# benchmarks/synthetic.py
+"""
+Synthetic data.json-shaped catalogs and JPEG posters for the benchmarks.
+
+    python benchmarks/synthetic.py OUT_FOLDER [--items N] [--posters N] [--layout list|split|jsonl]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+
+# Roughly the mix of the real data.json
+GENRE_WEIGHTS = {
+    "Drama": 30, "Action": 15, "Romance": 12, "Comedy": 11, "Thriller": 11, "Crime": 9,
+    "Mystery": 5, "Suspence": 3, "Musical": 3, "Family": 2, "Biographical": 2, "Adventure": 2,
+    "Horror": 1, "Fantasy": 1, "Science Fiction": 1, "Period Drama": 1, "Sports Drama": 1,
+}
+LANGUAGE_WEIGHTS = {"Hindi": 60, "English": 25, "Tamil": 6, "Telugu": 5, "Marathi": 4}
+TYPE_WEIGHTS = {"Movie": 47, "Web Series": 53}
+
+# Poster files as they come from the web: portrait, a few hundred KB
+POSTER_SIZE = (600, 900)
+POSTER_QUALITY = 88
+
+_SYLLABLES = ["aa", "ba", "dil", "ga", "ha", "ja", "ka", "la", "ma", "na", "pa", "ra", "sa", "ta",
+              "va", "ya", "zin", "dar", "pyar", "ishq", "raj", "sha", "kha", "bhai", "jaan", "qui"]
+_WORDS = ["the", "a", "of", "and", "story", "family", "city", "young", "love", "war", "secret",
+          "journey", "friends", "life", "power", "truth", "village", "brothers", "night", "dream"]
+
+
+def _pick(rng, weights):
+    return rng.choices(list(weights), weights=list(weights.values()))[0]
+
+
+def _title(rng):
+    words = []
+    for _ in range(rng.choice((1, 1, 2, 2, 3))):
+        word = "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(1, 3)))
+        words.append(word.capitalize())
+    if rng.random() < 0.02:
+        words.append("Café")        # a few accented titles, as search has to fold them
+    return " ".join(words)
+
+
+def make_item(rng, posters=(), genre_weights=GENRE_WEIGHTS, language_weights=LANGUAGE_WEIGHTS,
+              multi_language=0.45, desc_words=30):
+    """One data.json-style item dict."""
+    genres = list(dict.fromkeys(_pick(rng, genre_weights) for _ in range(rng.randint(1, 3))))
+    language = _pick(rng, language_weights)
+    if rng.random() < multi_language:
+        language = list(dict.fromkeys([language, _pick(rng, language_weights)]))
+    words = max(1, int(rng.gauss(desc_words, desc_words / 3)))
+    return {
+        "title": _title(rng),
+        "type": _pick(rng, TYPE_WEIGHTS),
+        "genres": genres,
+        "year": rng.randint(1970, 2025),
+        "language": language,
+        "rating": round(rng.uniform(4.0, 9.8), 1),
+        "poster": rng.choice(posters) if posters else "",
+        "description": " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize() + ".",
+        "trailer_url": f"https://youtu.be/{rng.getrandbits(48):012x}",
+    }
+
+
+def generate_catalog(path, n, posters=(), layout="list", seed=0, **options):
+    """
+    Write `n` synthetic items to `path` in one of the layouts iter_catalog reads:
+    a list ("list"), {"movies": [...], "series": [...]} ("split") or JSON Lines.
+    `options` go to make_item (genre / language weights, desc_words...).
+    """
+    rng = random.Random(seed)
+    items = [make_item(rng, posters, **options) for _ in range(n)]
+    with open(path, "w", encoding="utf-8") as f:
+        if layout == "jsonl":
+            for item in items:
+                f.write(json.dumps(item, ensure_ascii=False) + "\n")
+        elif layout == "split":
+            json.dump({"movies": [i for i in items if i["type"] == "Movie"],
+                       "series": [i for i in items if i["type"] != "Movie"]}, f, ensure_ascii=False, indent=2)
+        else:
+            json.dump(items, f, ensure_ascii=False, indent=2)
+    return path
+
+
+def generate_posters(folder, count, size=POSTER_SIZE, quality=POSTER_QUALITY, seed=0):
+    """
+    Write `count` JPEG posters to `folder` and return their paths. Each is a
+    colour gradient with noise and a few shapes, so it compresses (and decodes)
+    like real key art rather than a flat image.
+    """
+    from PIL import Image, ImageDraw
+
+    rng = random.Random(seed)
+    os.makedirs(folder, exist_ok=True)
+    paths = []
+    for i in range(count):
+        path = os.path.join(folder, f"poster_{i:05d}.jpg")
+        paths.append(path)
+        if os.path.exists(path):
+            continue
+        top = tuple(rng.randrange(256) for _ in range(3))
+        bottom = tuple(rng.randrange(256) for _ in range(3))
+        gradient = Image.linear_gradient("L").resize(size)
+        img = Image.composite(Image.new("RGB", size, bottom), Image.new("RGB", size, top), gradient)
+        img = Image.blend(img, Image.effect_noise(size, 48).convert("RGB"), 0.25)
+        draw = ImageDraw.Draw(img)
+        for _ in range(6):
+            x, y = rng.randrange(size[0]), rng.randrange(size[1])
+            r = rng.randint(20, size[0] // 3)
+            draw.ellipse((x - r, y - r, x + r, y + r), fill=tuple(rng.randrange(256) for _ in range(3)))
+        img.save(path, "JPEG", quality=quality)
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("folder")
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--posters", type=int, default=50)
+    parser.add_argument("--layout", choices=("list", "split", "jsonl"), default="list")
+    parser.add_argument("--desc-words", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    posters = generate_posters(os.path.join(args.folder, "posters"), args.posters, seed=args.seed)
+    name = "data.jsonl" if args.layout == "jsonl" else "data.json"
+    path = generate_catalog(os.path.join(args.folder, name), args.items, posters, args.layout,
+                            seed=args.seed, desc_words=args.desc_words)
+    print(f"Wrote {args.items} items to {path} and {len(posters)} posters")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+# card_builder.py
+import time
+
+import perf
+
+# Time one slice of building may take before handing the event loop back (ms, of a ~16 ms frame)
+FRAME_BUDGET_MS = 12
+
+
+class ChunkedBuilder:
+    """
+    Run a page's build steps (usually one card each) on the Tk event loop in
+    small slices instead of one long loop. Each slice runs steps until
+    `budget_ms` is used up, then yields: the next slice is queued with
+    after_idle (so pending redraws go first) and after(1) (so clicks and
+    keystrokes get through). Steps run in order, so giving them top row first
+    builds what is on screen first; the first `first` steps run right away in
+    `start()`, so the top row is drawn with the next frame.
+
+    `cancel()` stops a build cleanly, e.g. when the user navigates away. A
+    finished build's duration, first step to last, goes to the perf metrics
+    under the `name` given to `start()`.
+    """
+
+    def __init__(self, root, budget_ms=FRAME_BUDGET_MS):
+        self.root = root
+        self.budget_ms = budget_ms
+        self._steps = None
+        self._after_id = None
+        self._on_done = None
+        self._name = None
+        self._started = 0.0
+
+    @property
+    def active(self):
+        return self._steps is not None
+
+    def start(self, steps, first=0, on_done=None, name="page build"):
+        """Build `steps` (callables), replacing any build still running. `on_done()` runs at the end."""
+        self.cancel()
+        self._steps = iter(steps)
+        self._on_done = on_done
+        self._name = name
+        self._started = time.perf_counter()
+        for _ in range(first):
+            if not self._step():
+                return
+        self._after_id = self.root.after_idle(self._next_frame)
+
+    def cancel(self):
+        """Drop the remaining steps. Returns True if a build was still running."""
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        running = self._steps is not None
+        self._steps = None
+        self._on_done = None
+        return running
+
+    def _step(self):
+        """Run the next step. False once the build is over (finished or failed)."""
+        try:
+            next(self._steps)()
+            return True
+        except StopIteration:
+            self._finish()
+        except Exception as e:
+            print("Error building page:", e)
+            self.cancel()
+        return False
+
+    def _run(self):
+        self._after_id = None
+        with perf.span("card slice"):
+            deadline = time.perf_counter() + self.budget_ms / 1000
+            while self._steps is not None:
+                if not self._step():
+                    return
+                if time.perf_counter() >= deadline:
+                    self._after_id = self.root.after_idle(self._next_frame)
+                    return
+
+    def _next_frame(self):
+        self._after_id = self.root.after(1, self._run)
+
+    def _finish(self):
+        on_done = self._on_done
+        self._steps = None
+        self._on_done = None
+        if perf.ENABLED:
+            perf.record(self._name, (time.perf_counter() - self._started) * 1000)
+        if on_done is not None:
+            on_done()
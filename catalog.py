@@ -0,0 +1,298 @@
+# catalog.py
+import json
+import re
+import sys
+import threading
+import unicodedata
+
+# Characters read from data.json per step of the incremental parser
+CHUNK_SIZE = 64 * 1024
+
+_WS = re.compile(r"\s*")
+_decoder = json.JSONDecoder()
+
+
+# ----------------- Normalization -----------------
+def fold(text):
+    """
+    Search / sort key for a string: casefolded, accents stripped, whitespace
+    collapsed ("  Pokémon  Movie" -> "pokemon movie").
+    """
+    text = " ".join(str(text).casefold().split())
+    if text.isascii():
+        return text
+    return "".join(ch for ch in unicodedata.normalize("NFKD", text) if not unicodedata.combining(ch))
+
+
+def canonical_type(value):
+    """"Movie" -> "movie"; "Web Series" / "series" -> "series"; missing -> "movie"."""
+    t = " ".join(str(value or "").casefold().split())
+    if "series" in t:
+        return "series"
+    return sys.intern(t or "movie")
+
+
+_languages = {}      # casefolded language -> spelling shown for it
+
+
+def canonical_language(value):
+    """
+    "Hindi", "HINDI" and " hindi" are the same language. It is shown as first
+    spelled in the catalog; an all-lowercase first spelling gets capital
+    initials ("brazilian portuguese" -> "Brazilian Portuguese", "ASL" stays).
+    """
+    name = " ".join(str(value).split())
+    key = name.casefold()
+    shown = _languages.get(key)
+    if shown is None:
+        if name.islower():
+            name = " ".join(word[:1].upper() + word[1:] for word in name.split())
+        shown = _languages.setdefault(key, sys.intern(name))
+    return shown
+
+
+def clean_genres(genres):
+    """Genre names stripped, with empty entries and repeats dropped (order kept)."""
+    if isinstance(genres, str):
+        genres = [genres]
+    names = (" ".join(str(g).split()) for g in genres or ())
+    return list(dict.fromkeys(g for g in names if g))
+
+
+# ----------------- Compact item records -----------------
+GENRES = []          # genre id -> interned genre name
+_genre_ids = {}      # genre name -> id
+_genre_lock = threading.Lock()   # the snapshot loader thread assigns ids while the stream does
+
+
+def genre_id(name):
+    """Small int id for a genre name (assigned on first use)."""
+    gid = _genre_ids.get(name)
+    if gid is None:
+        with _genre_lock:
+            gid = _genre_ids.get(name)
+            if gid is None:
+                gid = len(GENRES)
+                GENRES.append(sys.intern(name))
+                _genre_ids[GENRES[gid]] = gid
+    return gid
+
+
+def adopt_genres(names, items):
+    """
+    Make records unpickled from a catalog snapshot, whose genre ids index
+    `names`, valid against this process's GENRES table.
+    """
+    remap = [genre_id(name) for name in names]
+    if remap != list(range(len(names))):
+        for item in items:
+            item.genre_ids = tuple(remap[g] for g in item.genre_ids)
+
+
+def _canonical_languages(value):
+    # a single language or several ("language": ["Hindi", "English"])
+    if isinstance(value, (list, tuple)):
+        langs = tuple(dict.fromkeys(canonical_language(v) for v in value if str(v).strip()))
+        return langs[0] if len(langs) == 1 else langs
+    return canonical_language(value) if value not in (None, "") else ""
+
+
+class CatalogItem:
+    """
+    One catalog entry. Replaces the per-item dict: fixed slots instead of a
+    hash table, type / language strings interned (shared by every item), and
+    genres kept as a tuple of ids into GENRES. Keys data.json has beyond the
+    known fields go to `extra`. `get()` keeps the dict-style access used by
+    generic code (facet extractors, the SQLite store, data.py).
+
+    The constructor is the one normalization pass: type is "movie" / "series",
+    languages are canonical, genres are de-duplicated, and the search key
+    (`title_key`) and card strings (`info_text`, `genres_text`, ...) are built
+    here once instead of in every filter, search and render call.
+    """
+
+    __slots__ = ("title", "type", "poster", "year", "rating", "language", "genre_ids",
+                 "description", "trailer_url", "extra",
+                 "title_key", "language_text", "genres_text", "info_text")
+
+    FIELDS = frozenset(("title", "type", "poster", "year", "rating", "language", "genres",
+                        "description", "trailer_url"))
+
+    def __init__(self, title="Untitled", type="movie", poster="", year="", rating="", language="",
+                 genres=(), description="", trailer_url="", extra=None):
+        self.title = str(title).strip() or "Untitled"
+        self.type = canonical_type(type)
+        self.poster = poster
+        self.year = year
+        self.rating = rating
+        self.language = _canonical_languages(language)
+        self.genre_ids = tuple(genre_id(g) for g in clean_genres(genres))
+        self.description = description
+        self.trailer_url = trailer_url
+        self.extra = extra or None
+
+        # precomputed keys and display strings
+        self.title_key = fold(self.title)
+        if isinstance(self.language, tuple):
+            self.language_text = sys.intern(", ".join(self.language))
+        else:
+            self.language_text = self.language
+        self.genres_text = sys.intern(", ".join(GENRES[g] for g in self.genre_ids))
+        self.info_text = f"{year} | ⭐ {rating} | {self.language_text}"
+
+    @classmethod
+    def from_dict(cls, d, default_type="movie"):
+        """Build a record from a parsed item dict (the dict is consumed)."""
+        trailer_url = d.pop("trailer_url", None)
+        if trailer_url is None:
+            trailer_url = d.get("trailer") or ""
+        return cls(title=d.pop("title", "Untitled"), type=d.pop("type", default_type),
+                   poster=d.pop("poster", ""), year=d.pop("year", ""), rating=d.pop("rating", ""),
+                   language=d.pop("language", ""), genres=d.pop("genres", ()),
+                   description=d.pop("description", ""), trailer_url=trailer_url, extra=d)
+
+    @property
+    def genres(self):
+        return tuple(GENRES[g] for g in self.genre_ids)
+
+    @property
+    def languages(self):
+        if isinstance(self.language, tuple):
+            return self.language
+        return (self.language,) if self.language else ()
+
+    def get(self, key, default=None):
+        if key in self.FIELDS:
+            return getattr(self, key)
+        if self.extra:
+            return self.extra.get(key, default)
+        return default
+
+    def to_dict(self):
+        d = {"title": self.title, "type": self.type, "genres": list(self.genres), "year": self.year,
+             "language": list(self.language) if isinstance(self.language, tuple) else self.language,
+             "rating": self.rating, "poster": self.poster, "description": self.description,
+             "trailer_url": self.trailer_url}
+        if self.extra:
+            d.update(self.extra)
+        return d
+
+    def __repr__(self):
+        return f"CatalogItem({self.title!r}, {self.type!r})"
+
+
+def normalize_item(item, default_type="movie"):
+    """Turn a parsed item dict into a CatalogItem with every field the UI expects filled in."""
+    return CatalogItem.from_dict(item, default_type)
+
+
+class _Reader:
+    """Text buffer over a file that only ever holds the chunk(s) of the value being parsed."""
+
+    def __init__(self, f, chunk_size):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        """Append one more chunk (dropping what was already consumed). False at end of file."""
+        if self.eof:
+            return False
+        data = self.f.read(self.chunk_size)
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        if not data:
+            self.eof = True
+        return bool(data)
+
+    def peek(self):
+        """Next non-whitespace character without consuming it ("" at end of file)."""
+        while True:
+            self.pos = _WS.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, ch):
+        if self.peek() != ch:
+            raise ValueError(f"Expected {ch!r} in catalog file")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value, reading more of the file until it fits in the buffer."""
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+                # a value ending right at the buffer edge may be cut short (e.g. a number)
+                if end < len(self.buf) or self.eof:
+                    self.pos = end
+                    return obj
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self.fill()
+
+    def array(self):
+        """Yield the elements of the JSON array starting at the current position, one at a time."""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self.expect("]")
+            return
+
+
+def iter_catalog(path="data.json", chunk_size=CHUNK_SIZE):
+    """
+    Yield catalog items (CatalogItem records) from `path` as they are parsed.
+
+    Accepts the two data.json layouts (a list of items, or {"movies": [...],
+    "series": [...]}) and JSON Lines (`.jsonl`, one item per line). Only the
+    item being decoded is held in memory besides the items already yielded,
+    so the caller can show the first page before the rest of the file is read.
+    """
+    if path.endswith(".jsonl"):
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield normalize_item(json.loads(line))
+        return
+
+    with open(path, "r", encoding="utf-8") as f:
+        reader = _Reader(f, chunk_size)
+        first = reader.peek()
+        if first == "[":
+            for item in reader.array():
+                if isinstance(item, dict):
+                    yield normalize_item(item)
+        elif first == "{":
+            reader.pos += 1
+            if reader.peek() == "}":
+                return
+            while True:
+                key = reader.value()
+                reader.expect(":")
+                if key in ("movies", "series") and reader.peek() == "[":
+                    default_type = "movie" if key == "movies" else "web series"
+                    for item in reader.array():
+                        if isinstance(item, dict):
+                            yield normalize_item(item, default_type)
+                else:
+                    reader.value()   # some other top-level key: skip it
+                if reader.peek() == ",":
+                    reader.pos += 1
+                    continue
+                reader.expect("}")
+                return
+        elif first:
+            raise ValueError("Catalog file must hold a JSON list or object")
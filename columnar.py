@@ -0,0 +1,147 @@
+# columnar.py
+try:
+    import numpy as np
+except ImportError:          # optional: the app falls back to the bitmap indexes in facets.py
+    np = None
+
+from facets import genre_values, language_values, number_value, title_key, type_values
+
+HAVE_NUMPY = np is not None
+
+
+def _membership(items, extract):
+    """(vocabulary, bool matrix [n_items, n_values]) for a multi-valued field."""
+    vocab = {}
+    rows, cols = [], []
+    for i, item in enumerate(items):
+        for v in extract(item):
+            rows.append(i)
+            cols.append(vocab.setdefault(v, len(vocab)))
+    matrix = np.zeros((len(items), len(vocab)), dtype=bool)
+    matrix[rows, cols] = True
+    return vocab, matrix
+
+
+class ColumnarCatalog:
+    """
+    Column-oriented copy of the catalog for vectorized filtering and scoring
+    (needs NumPy). Built once from the loaded items, positions match data_items:
+
+        year, rating        float64 arrays (NaN when missing)
+        type                int16 codes into `types` ("movie" / "series")
+        genre, language     bool membership matrices (items can have several)
+        title_rank          position of each item in A–Z order
+
+    `mask()` takes the same criteria as FacetIndex.filter and returns a bool
+    array; `ids()` / `top()` turn a mask into an index array for populate_grid:
+
+        cols = ColumnarCatalog(items)
+        m = cols.mask(genre="Drama", language="Hindi", year=(2011, None), rating=(8, None))
+        shown = [items[i] for i in cols.top("rating", 50, m, reverse=True)]
+    """
+
+    def __init__(self, items):
+        if np is None:
+            raise ImportError("ColumnarCatalog needs numpy")
+        items = list(items)
+        self.n = len(items)
+        self.year = np.array([number_value("year")(it) for it in items], dtype=float)
+        self.rating = np.array([number_value("rating")(it) for it in items], dtype=float)
+        self.types = {}
+        self.type = np.array([self.types.setdefault(type_values(it)[0], len(self.types)) for it in items],
+                             dtype=np.int16)
+        self.genres, self.genre = _membership(items, genre_values)
+        self.languages, self.language = _membership(items, language_values)
+        order = sorted(range(self.n), key=lambda i: title_key(items[i]))
+        self.title_rank = np.empty(self.n, dtype=float)
+        self.title_rank[order] = np.arange(self.n)
+
+    def __len__(self):
+        return self.n
+
+    # ----------------- Filtering -----------------
+    def _any_of(self, vocab, matrix, value):
+        values = value if isinstance(value, (list, tuple, set)) else [value]
+        cols = [vocab[v] for v in values if v in vocab]
+        if not cols:
+            return np.zeros(self.n, dtype=bool)
+        return matrix[:, cols].any(axis=1)
+
+    @staticmethod
+    def _between(column, bounds):
+        lo, hi = bounds
+        m = ~np.isnan(column)
+        if lo is not None:
+            m &= column >= lo
+        if hi is not None:
+            m &= column <= hi
+        return m
+
+    def mask(self, base=None, type=None, genre=None, language=None, year=None, rating=None):
+        """Bool array of items matching every given criterion (None criteria are ignored)."""
+        m = np.ones(self.n, dtype=bool) if base is None else base.copy()
+        if type is not None:
+            types = type if isinstance(type, (list, tuple, set)) else [type]
+            m &= np.isin(self.type, [self.types[t] for t in types if t in self.types])
+        if genre is not None:
+            m &= self._any_of(self.genres, self.genre, genre)
+        if language is not None:
+            m &= self._any_of(self.languages, self.language, language)
+        if year is not None:
+            m &= self._between(self.year, year)
+        if rating is not None:
+            m &= self._between(self.rating, rating)
+        return m
+
+    def counts(self, facet, mask=None):
+        """{genre or language: matching items}, like FacetIndex.counts."""
+        vocab, matrix = (self.genres, self.genre) if facet == "genre" else (self.languages, self.language)
+        sums = (matrix if mask is None else matrix[mask]).sum(axis=0)
+        return {v: int(sums[c]) for v, c in vocab.items() if sums[c]}
+
+    @staticmethod
+    def ids(mask):
+        """Ascending item positions set in `mask`."""
+        return np.flatnonzero(mask)
+
+    # ----------------- Scoring / ordering -----------------
+    def _column(self, name):
+        return {"rating": self.rating, "year": self.year, "title": self.title_rank}[name]
+
+    def score(self, rating=1.0, year=0.0, genres=None):
+        """
+        Weighted score per item: rating and year scaled to [0, 1] and weighted,
+        plus `genres` {genre: bonus} for each matching genre. Missing values count as 0.
+        """
+        total = np.zeros(self.n)
+        for weight, column in ((rating, self.rating), (year, self.year)):
+            if not weight or not self.n or np.isnan(column).all():
+                continue
+            lo, hi = np.nanmin(column), np.nanmax(column)
+            scaled = (column - lo) / (hi - lo) if hi > lo else np.ones(self.n)
+            total += weight * np.nan_to_num(scaled)
+        for genre, bonus in (genres or {}).items():
+            col = self.genres.get(genre)
+            if col is not None:
+                total += bonus * self.genre[:, col]
+        return total
+
+    def top(self, key, n=None, mask=None, reverse=False):
+        """
+        Index array of the first `n` items (all when None) within `mask`, ordered
+        by `key` ("rating", "year", "title" or a score array from `score()`).
+        Items without a value come last; ties keep catalog order.
+        """
+        values = self._column(key) if isinstance(key, str) else np.asarray(key, dtype=float)
+        idx = np.arange(self.n) if mask is None else np.flatnonzero(mask)
+        vals = values[idx]
+        missing = np.isnan(vals)
+        keyed = np.where(missing, 0.0, -vals if reverse else vals)
+        if n is not None and n < len(idx):
+            # only items up to the n-th best value need a full sort
+            filled = np.where(missing, np.inf, keyed)
+            keep = filled <= np.partition(filled, n - 1)[n - 1]
+            idx, keyed, missing = idx[keep], keyed[keep], missing[keep]
+        order = np.lexsort((idx, keyed, missing))
+        result = idx[order]
+        return result if n is None else result[:n]
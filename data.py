@@ -1,11 +1,10 @@
 # data.py
+import perf   # first, so the startup marks include the imports below
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import messagebox
-from PIL import Image
-import json
 import os
-import webbrowser
+from catalog import fold, iter_catalog, normalize_item
 
 # ----------------- Global Login Helpers (use with Toplevel) -----------------
 def clear_email_placeholder(event):
@@ -30,6 +29,7 @@ def on_login():
     # Close login window and show main app
     login_window.destroy()
     app.deiconify()
+    perf.mark_when_idle(app, "first grid")
 
 
 # ----------------- Movie App -----------------
@@ -159,25 +159,15 @@ class MovieApp(ctk.CTk):
         }
         try:
             if os.path.exists("data.json"):
-                with open("data.json", "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                # Accept list or dict; normalize to dict
-                if isinstance(data, list):
-                    # try splitting by "type"
-                    movies = [x for x in data if str(x.get("type", "")).lower() == "movie"]
-                    series = [x for x in data if str(x.get("type", "")).lower() in ("series", "web series")]
-                    # if not typed, put all into movies
-                    if not movies and not series:
-                        movies = data
-                    return {"movies": movies, "series": series}
-                if isinstance(data, dict):
-                    return {
-                        "movies": list(data.get("movies", [])),
-                        "series": list(data.get("series", [])),
-                    }
+                # stream items straight into the two lists (no whole-file json.load + copies)
+                movies, series = [], []
+                for item in iter_catalog("data.json"):
+                    (series if item.type == "series" else movies).append(item)
+                return {"movies": movies, "series": series}
         except Exception as e:
             print("Failed to read data.json, using defaults. Error:", e)
-        return default_data
+        return {"movies": [normalize_item(d, "movie") for d in default_data["movies"]],
+                "series": [normalize_item(d, "series") for d in default_data["series"]]}
 
     # ----------------- Utility -----------------
     def clear_content(self):
@@ -195,6 +185,7 @@ class MovieApp(ctk.CTk):
 
     def play_trailer(self, url):
         if url:
+            import webbrowser
             webbrowser.open(url)
         else:
             messagebox.showwarning("No Trailer", "Trailer URL not available.")
@@ -253,7 +244,7 @@ class MovieApp(ctk.CTk):
 
     # ----------------- Search -----------------
     def search_movies(self):
-        query = self.search_entry.get().strip().lower()
+        query = self.search_entry.get().strip()
         self.clear_content()
 
         header = ctk.CTkLabel(
@@ -265,7 +256,8 @@ class MovieApp(ctk.CTk):
 
         all_items = list(self.movies_data.get("movies", [])) + list(self.movies_data.get("series", []))
         if query:
-            results = [x for x in all_items if query in str(x.get("title", "")).lower()]
+            key = fold(query)
+            results = [x for x in all_items if key in x.title_key]
         else:
             results = all_items
 
@@ -346,8 +338,8 @@ if __name__ == "__main__":
 
     # Optional background
     if os.path.exists("bgimage.jpg"):
-        bg_image = Image.open("bgimage.jpg")
-        bg = ctk.CTkImage(bg_image, size=(1600, 900))
+        from thumbcache import load_background
+        bg = ctk.CTkImage(load_background("bgimage.jpg", (1600, 900)), size=(1600, 900))
         bg_label = ctk.CTkLabel(login_window, image=bg, text="")
         bg_label.place(relx=0.5, rely=0.5, anchor="center")
 
@@ -372,4 +364,5 @@ if __name__ == "__main__":
     ctk.CTkLabel(frame, text="New to MovieMAX? Sign up now", font=("Arial", 10), text_color="white").pack()
     ctk.CTkLabel(frame, text="Protected by Google reCAPTCHA", font=("Arial", 9), text_color="gray").pack(pady=(2,0))
 
+    perf.mark_when_idle(app, "login window")
     app.mainloop()
@@ -1,40 +1,89 @@
 # data.py
+import perf   # first, so the startup marks include the imports below
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import messagebox
-from PIL import Image, ImageTk
-import json
+import gc
 import os
-import webbrowser
+import threading
+import time
+from functools import partial
+# PIL, webbrowser, numpy and the poster decoder are imported where first needed (after login)
+from image_cache import ImageCache, image_nbytes
+from card_builder import ChunkedBuilder
+from virtual_grid import VirtualGrid
+from search_index import FuzzyIndex, NgramIndex, QueryCache
+from facets import FacetIndex, SortIndex
+from catalog import GENRES, adopt_genres, iter_catalog
+import snapshot
 
 # ---------------- Global helper placeholders (will be bound in login) ----------------
 email_entry = None
 password_entry = None
 
+# Memory budget for decoded poster images shared by all views (bytes)
+IMAGE_CACHE_BYTES = 96 * 1024 * 1024
+
+# Poster resampling: "fast", "balanced" or "quality" (see thumbcache.RESAMPLE_POLICIES)
+POSTER_RESAMPLE_POLICY = "balanced"
+
+# Views with more items than this use the windowed (recycled) grid
+VIRTUAL_GRID_THRESHOLD = 150
+
+# Grid / home pages build cards for at most this long per frame before yielding to Tk (ms)
+CARD_FRAME_BUDGET_MS = 12
+
+# Search waits this long after the last keystroke before rebuilding the grid (ms)
+SEARCH_DEBOUNCE_MS = 250
+
+# Fuzzy search: how many ranked near misses to add after the exact hits, and the shortest query it is used for
+FUZZY_TOP_K = 30
+FUZZY_MIN_QUERY = 3
+
+# First entry of the genre / language filter menus
+ALL_GENRES = "All genres"
+ALL_LANGUAGES = "All languages"
+
+# Items parsed before the first screen; the rest of the catalog streams in chunks from after()
+CATALOG_FIRST_PAGE = 200
+CATALOG_CHUNK = 500
+
+# Catalogs at least this large get a NumPy column copy for filtering / sorting (when numpy is installed)
+COLUMNAR_MIN_ITEMS = 20000
+
+# How often the Tk thread checks whether the snapshot thread is done (ms)
+SNAPSHOT_POLL_MS = 50
+
+# Settings window metrics panel: refresh period (ms) and histogram bar glyphs
+METRICS_REFRESH_MS = 1000
+_BARS = "▁▂▃▄▅▆▇█"
+
+# Sort menu: label -> (sort key, descending, how many items to show); None keeps catalog order
+SORTED_TOP_N = 100
+SORT_MODES = {
+    "Default order": None,
+    "Top rated": ("rating", True, SORTED_TOP_N),
+    "Newest": ("year", True, SORTED_TOP_N),
+    "A–Z": ("title", False, None),
+}
+
 # ----------------- Utility functions -----------------
 def load_data_file(path="data.json"):
-    """Load movie/series data from JSON file. Return a list of dicts (items)."""
+    """Load movie/series data from JSON file. Return a list of CatalogItem records."""
+    return list(iter_catalog_items(path))
+
+
+def iter_catalog_items(path="data.json"):
+    """
+    Yield normalized catalog items one at a time, streamed from data.json (see
+    catalog.iter_catalog). data.json is always the source; the optional SQLite
+    store (store.py) is a separate tool and is never read here.
+    """
     if os.path.exists(path):
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            # Accept either list or dict with 'movies'/'series'
-            if isinstance(data, dict):
-                # normalize to list of items with 'type'
-                items = []
-                for t in ("movies", "series"):
-                    for entry in data.get(t, []):
-                        # ensure 'type' set
-                        item = dict(entry)
-                        if "type" not in item:
-                            item["type"] = "movie" if t == "movies" else "web series"
-                        items.append(item)
-                return items
-            elif isinstance(data, list):
-                return data
+            yield from iter_catalog(path)
         except Exception as e:
             print("Error loading data.json:", e)
-    return []
 
 
 # Placeholder messagebox wrappers (use tkinter.messagebox)
@@ -113,23 +162,20 @@ class MovieApp(ctk.CTk):
         ctk.set_default_color_theme("dark-blue")
         self.configure(fg_color="#121212")
 
-        # Data and state
-        self.data_items = load_data_file("data.json")  # list of dicts
-        # ensure each item has required keys to avoid KeyError
-        for it in self.data_items:
-            it.setdefault("title", "Untitled")
-            it.setdefault("type", "movie")
-            it.setdefault("poster", "")
-            it.setdefault("year", "")
-            it.setdefault("rating", "")
-            it.setdefault("language", "")
-            it.setdefault("genres", [])
-            it.setdefault("description", "")
-            it.setdefault("trailer_url", it.get("trailer") or it.get("trailer_url", ""))
-
-        self.filtered_data = list(self.data_items)
+        self._facet_labels = {"genre": {}, "language": {}}   # menu label -> facet value
+        self._search_after_id = None
+        self._search_ids = None       # ids shown by the current search results page (None: not searching)
+        self._grid_title = None       # header label of the last non-virtual populate_grid
+
         self.image_refs = []          # to hold CTkImage refs so they don't gc
-        self.loaded_ctkimages = {}    # cache CTkImage by path
+        self.loaded_ctkimages = ImageCache(IMAGE_CACHE_BYTES)  # cache CTkImage by (path, size)
+        self.poster_loader = None     # PosterLoader, decodes posters off the Tk thread (see _build_main)
+        self.poster_atlas = None      # PosterAtlas (python poster_atlas.py builds it)
+        self.poster_manifest = None   # PosterManifest, maps duplicate poster files to one path
+        self._placeholders = {}       # size -> placeholder CTkImage
+        self.view_frames = {}         # view name -> page frame kept alive between visits
+        self._build_page = None       # page currently being filled (poster requests are grouped by page)
+        self.card_builder = ChunkedBuilder(self, CARD_FRAME_BUDGET_MS)   # builds pages a frame-sized slice at a time
         self.watchlist = []           # user watchlist (list of items)
         self.current_filter = None
 
@@ -141,16 +187,216 @@ class MovieApp(ctk.CTk):
         self.content_frame = None
         self.content_window = None
 
-        # Start by making widgets and then opening login as Toplevel
-        self.create_main_widgets()
-        # Hide main window until login success
+        self._login_bg = None         # CTkImage of the scaled login background
+        # Login comes first: the main window stays hidden (and unbuilt) until Tk is idle
         self.withdraw()
+        self._main_built = False
         self.create_login_window()
-        
+        perf.mark_when_idle(self, "login window")
+        self.after_idle(self._build_main)
 
         
     
 
+    # ----------------- Deferred main window -----------------
+    def _build_main(self):
+        """Load the catalog and build the (hidden) main window. Runs once, behind the login window."""
+        if self._main_built:
+            return
+        self._main_built = True
+        from poster_loader import PosterLoader   # imports PIL
+        import thumbcache
+        thumbcache.set_resample_policy(POSTER_RESAMPLE_POLICY)
+        self.poster_loader = PosterLoader(self)
+        from poster_atlas import PosterAtlas
+        self.poster_atlas = PosterAtlas.open()   # packed 160x250 thumbnails, None if not built
+        from poster_manifest import PosterManifest
+        self.poster_manifest = PosterManifest()   # hashes from the last run; refreshed once the catalog is in
+
+        # Data and state: items stream in from data.json (normalized once by the loader),
+        # the first page here and the rest by _load_catalog_chunk while the login window
+        # is up. A current binary snapshot is read on a worker thread meanwhile and
+        # replaces the streamed data as soon as it is ready (see _poll_snapshot).
+        self.columns = None           # ColumnarCatalog, built once the whole catalog is in
+        self._load_started = time.perf_counter()
+        self.data_items = []          # list of CatalogItem records, doc id = position
+        # n-gram index over titles for search (doc ids are positions in data_items)
+        self.title_index = NgramIndex()
+        self.fuzzy_index = FuzzyIndex()   # typo tolerant, ranked (Hinglish spellings)
+        # bitmap indexes for type / genre / language and year / rating ranges
+        self.facets = FacetIndex()
+        self.sorts = SortIndex()      # precomputed rating / year / title orders
+        self._snapshot_stat = None    # data.json (mtime, size) when it was streamed; snapshot written after
+        # None while the snapshot thread runs, then its payload; False: no usable snapshot,
+        # True: a current one was found (used, or beaten by the stream)
+        self._snapshot_payload = False
+        if os.path.exists("data.json"):
+            self._snapshot_stat = snapshot.file_stat("data.json")
+            if os.path.exists(snapshot.snapshot_path("data.json")):
+                self._snapshot_payload = None
+                threading.Thread(target=self._read_snapshot, args=("data.json",), daemon=True).start()
+        self._catalog_iter = iter_catalog_items("data.json")
+        self._ingest_items(CATALOG_FIRST_PAGE)
+        self.search_cache = QueryCache(self.title_index)   # recent query -> ids, refined as you type
+        self.filtered_data = self.data_items
+
+        self.create_main_widgets()
+        # (a catalog that fit in the first page is already complete)
+        self.after_idle(self._load_catalog_chunk if self._catalog_iter is not None else self._stream_finished)
+        if self._snapshot_payload is None:
+            self.after(SNAPSHOT_POLL_MS, self._poll_snapshot)
+
+    # ----------------- Catalog loading -----------------
+    def _read_snapshot(self, path):
+        """
+        Worker thread: load the snapshot of `path`, restore the search indexes and
+        rebuild the facet bitmaps and sort orders (not stored, they are cheap to
+        rebuild). The result is handed to the Tk thread through _snapshot_payload.
+        """
+        payload = None
+        # the load allocates millions of objects; with the collector on, its full passes
+        # over them (hundreds of ms each, GIL held) are what would stall the UI
+        gc.disable()
+        try:
+            payload = snapshot.load(path)
+            if payload is not None and self._catalog_iter is not None:
+                items = payload["items"]
+                adopt_genres(payload["genres"], items)
+                payload["title_index"] = NgramIndex.from_state(payload["title_docs"], payload["title_postings"])
+                payload["fuzzy_index"] = FuzzyIndex.from_state(payload["fuzzy_docs"], payload["fuzzy_postings"])
+                payload["facets"] = FacetIndex()
+                payload["sorts"] = SortIndex()
+                payload["facets"].add_many(enumerate(items))
+                payload["sorts"].add_many(enumerate(items))
+                payload["facets"].flush()
+                payload["sorts"].flush()
+        except Exception as e:
+            print("Could not load catalog snapshot:", e)
+            payload = None
+        finally:
+            gc.enable()
+        self._snapshot_payload = payload or False
+
+    def _poll_snapshot(self):
+        """Swap in the snapshot once the worker has it, unless streaming already finished."""
+        payload = self._snapshot_payload
+        if payload is None:
+            self.after(SNAPSHOT_POLL_MS, self._poll_snapshot)
+            return
+        if payload is False:
+            # stale or unreadable: the streamed catalog is written as the new snapshot
+            if self._catalog_iter is None and self._snapshot_stat is not None:
+                self._save_snapshot()
+            return
+        self._snapshot_payload = True   # current snapshot: nothing to write back
+        self._snapshot_stat = None
+        if self._catalog_iter is None:
+            return   # streaming got there first
+        self._catalog_iter = None       # stops _load_catalog_chunk
+        self.data_items = payload["items"]
+        self.title_index = payload["title_index"]
+        self.fuzzy_index = payload["fuzzy_index"]
+        self.facets = payload["facets"]
+        self.sorts = payload["sorts"]
+        self.search_cache = QueryCache(self.title_index)
+        self._catalog_complete()
+
+    def _save_snapshot(self):
+        """Write items + search indexes for the next start, off the Tk thread (nothing mutates them once loaded)."""
+        threading.Thread(target=self._write_snapshot, daemon=True,
+                         args=("data.json", self._snapshot_stat, self.data_items, self.title_index,
+                               self.fuzzy_index)).start()
+        self._snapshot_stat = None
+
+    @staticmethod
+    def _write_snapshot(path, stat, items, title_index, fuzzy_index):
+        payload = {"items": items, "genres": list(GENRES)}
+        payload["title_docs"], payload["title_postings"] = title_index.state()
+        payload["fuzzy_docs"], payload["fuzzy_postings"] = fuzzy_index.state()
+        snapshot.save(path, payload, stat)
+
+    def _catalog_loaded(self):
+        if perf.ENABLED:
+            perf.record("catalog load", (time.perf_counter() - self._load_started) * 1000)
+
+    def _refresh_poster_manifest(self):
+        """Hash new or changed poster files off the Tk thread (unchanged ones only cost a stat)."""
+        paths = [item.poster for item in self.data_items]
+        threading.Thread(target=self.poster_manifest.refresh, args=(paths,), daemon=True).start()
+
+    def _build_columns(self):
+        if len(self.data_items) < COLUMNAR_MIN_ITEMS:
+            return
+        from columnar import HAVE_NUMPY, ColumnarCatalog   # imports numpy
+        if HAVE_NUMPY:
+            try:
+                self.columns = ColumnarCatalog(self.data_items)
+            except Exception as e:
+                print("Columnar catalog unavailable:", e)
+
+    @perf.timed("catalog chunk")
+    def _ingest_items(self, limit):
+        """Pull up to `limit` items from the catalog stream into data_items and the indexes."""
+        if self._catalog_iter is None:
+            return
+        start = len(self.data_items)
+        try:
+            for _ in range(limit):
+                item = next(self._catalog_iter)
+                i = len(self.data_items)
+                self.data_items.append(item)
+                self.title_index.add(i, item.title_key)
+                self.fuzzy_index.add(i, item.title_key)
+            return
+        except StopIteration:
+            pass
+        except Exception as e:
+            print("Error loading catalog:", e)
+        finally:
+            # bulk adds: bitmaps / sort orders are built once, when next read (not per item)
+            added = list(enumerate(self.data_items[start:], start))
+            self.facets.add_many(added)
+            self.sorts.add_many(added)
+        self._catalog_iter = None
+
+    def _load_catalog_chunk(self):
+        """Load the next CATALOG_CHUNK items, then yield to Tk; refresh the catalog views once done."""
+        if self._catalog_iter is None:
+            return   # replaced by the snapshot
+        self._ingest_items(CATALOG_CHUNK)
+        if self._catalog_iter is not None:
+            self.after(1, self._load_catalog_chunk)
+            return
+        self._stream_finished()
+
+    def _stream_finished(self):
+        self.facets.flush()
+        self.sorts.flush()
+        if self._snapshot_stat is not None and self._snapshot_payload is False:
+            self._save_snapshot()   # no current snapshot: write one for the next start (else see _poll_snapshot)
+        self._catalog_complete()
+
+    def _catalog_complete(self):
+        """The whole catalog is in (streamed or from the snapshot): build the extras and refresh the views."""
+        if self._snapshot_payload is not None:
+            # the catalog lives as long as the app: keep it out of later collections
+            # (not while the snapshot thread runs, its objects may still be dropped)
+            gc.freeze()
+        self._build_columns()
+        self._refresh_poster_manifest()
+        self._catalog_loaded()
+        self.invalidate_views("home", "movies", "series")
+        if self._search_ids is None and self._on_catalog_view():
+            self.apply_facet_filters()
+
+    def _on_catalog_view(self):
+        """True when the page on screen was built from (possibly partial) catalog data."""
+        if self.virtual_grid.active:
+            return True
+        # hidden cached pages are pack_forget()-ed; this also works while the window is withdrawn
+        return any(w.winfo_manager() and w is not self.view_frames.get("watchlist")
+                   for w in self.content_frame.winfo_children())
+
     # ----------------- Main UI (keeps your original structure, adds profile button) -----------------
     def create_main_widgets(self):
         # Top navbar frame
@@ -192,6 +438,7 @@ class MovieApp(ctk.CTk):
         profile_icon_path = "profile.png"  # expected in project root
         try:
             if os.path.exists(profile_icon_path):
+                from PIL import Image
                 img = Image.open(profile_icon_path).resize((30, 30))
                 profile_icon = ctk.CTkImage(Image.open(profile_icon_path), size=(30, 30))
         except Exception:
@@ -217,7 +464,7 @@ class MovieApp(ctk.CTk):
         search_frame.pack(fill="x", padx=20, pady=(10, 0))
 
         self.search_var = ctk.StringVar()
-        self.search_var.trace_add("write", lambda *a: self.on_search_change())
+        self.search_var.trace_add("write", lambda *a: self._schedule_search())
 
         self.search_entry = ctk.CTkEntry(search_frame, 
                                         placeholder_text="🔍 Search movies or series...",
@@ -236,6 +483,29 @@ class MovieApp(ctk.CTk):
                                   command=self.clear_search)
         clear_btn.pack(side="left", padx=(8, 20), pady=10)
 
+        # Fuzzy mode: rank by spelling similarity instead of exact substring match
+        self.fuzzy_var = tk.BooleanVar(value=True)
+        ctk.CTkCheckBox(search_frame, text="Fuzzy match", variable=self.fuzzy_var,
+                        text_color="white", command=self._schedule_search).pack(side="left", padx=(0, 20))
+
+        # Genre / language filters (menus list per-value counts from the facet index)
+        self.genre_var = tk.StringVar(value=ALL_GENRES)
+        self.genre_menu = ctk.CTkOptionMenu(search_frame, variable=self.genre_var, values=[ALL_GENRES],
+                                            width=170, fg_color="#1A1F23", button_color="#2b2b2b",
+                                            command=self.apply_facet_filters)
+        self.genre_menu.pack(side="left", padx=(0, 8))
+        self.language_var = tk.StringVar(value=ALL_LANGUAGES)
+        self.language_menu = ctk.CTkOptionMenu(search_frame, variable=self.language_var, values=[ALL_LANGUAGES],
+                                               width=170, fg_color="#1A1F23", button_color="#2b2b2b",
+                                               command=self.apply_facet_filters)
+        self.language_menu.pack(side="left", padx=(0, 8))
+        self._refresh_facet_menus()
+
+        self.sort_var = tk.StringVar(value="Default order")
+        ctk.CTkOptionMenu(search_frame, variable=self.sort_var, values=list(SORT_MODES),
+                          width=140, fg_color="#1A1F23", button_color="#2b2b2b",
+                          command=self.apply_facet_filters).pack(side="left", padx=(0, 8))
+
         # Container + Canvas for scrollable content (same structure as original)
         self.content_container = ctk.CTkFrame(self)
         self.content_container.pack(fill="both", expand=True, padx=20, pady=15)
@@ -243,7 +513,7 @@ class MovieApp(ctk.CTk):
         self.canvas = tk.Canvas(self.content_container, bg="#121212", highlightthickness=0)
         self.canvas.pack(side="left", fill="both", expand=True)
 
-        v_scrollbar = tk.Scrollbar(self.content_container, orient="vertical", command=self.canvas.yview)
+        v_scrollbar = tk.Scrollbar(self.content_container, orient="vertical", command=self.on_scrollbar)
         v_scrollbar.pack(side="right", fill="y")
 
         self.canvas.configure(yscrollcommand=v_scrollbar.set)
@@ -255,6 +525,10 @@ class MovieApp(ctk.CTk):
         self.canvas.bind("<Configure>", self.on_canvas_configure)
         self.bind_all("<MouseWheel>", self.on_mousewheel)
 
+        # Windowed grid for large views: draws a recycled pool of cards on the same canvas
+        self.virtual_grid = VirtualGrid(self.canvas, self._make_virtual_card, self._bind_virtual_card,
+                                        make_header=self._make_virtual_header, cols=7)
+
     # ----------------- Profile Menu / Window -----------------
     def _open_profile_menu(self):
         """Open a small dropdown menu anchored to the profile button location."""
@@ -287,6 +561,7 @@ class MovieApp(ctk.CTk):
         avatar_path = "profile.png"
         if os.path.exists(avatar_path):
             try:
+                from PIL import Image
                 pil_img = Image.open(avatar_path).resize((90, 90))
                 avatar_img = ctk.CTkImage(pil_img, size=(90, 90))
                 ctk.CTkLabel(prof, image=avatar_img, text="").pack(pady=(20, 8))
@@ -307,15 +582,62 @@ class MovieApp(ctk.CTk):
         ctk.CTkButton(prof, text="Logout", fg_color="#FF3333", hover_color="#CC0000", command=self._logout).pack(pady=18)
 
     def open_settings_window(self):
+        # not modal: the metrics panel is meant to stay open while the app is used
         win = ctk.CTkToplevel(self)
         win.title("Settings")
-        win.geometry("480x300")
+        win.geometry("720x560")
         win.configure(fg_color="#1a1a1a")
-        win.grab_set()
 
-        ctk.CTkLabel(win, text="Settings", font=("Arial", 18, "bold"), text_color="white").pack(pady=16)
-        ctk.CTkLabel(win, text="(No settings available in demo)", text_color="#bbbbbb").pack(pady=8)
-        ctk.CTkButton(win, text="Close", command=win.destroy).pack(pady=18)
+        ctk.CTkLabel(win, text="Settings", font=("Arial", 18, "bold"), text_color="white").pack(pady=(16, 4))
+        ctk.CTkLabel(win, text="Performance", font=("Arial", 14, "bold"), text_color="#bbbbbb").pack(anchor="w", padx=20)
+
+        controls = ctk.CTkFrame(win, fg_color="transparent")
+        controls.pack(fill="x", padx=20, pady=6)
+        record_var = tk.BooleanVar(value=perf.ENABLED)
+        ctk.CTkSwitch(controls, text="Record timings", variable=record_var,
+                      command=lambda: perf.enable(record_var.get())).pack(side="left")
+        ctk.CTkButton(controls, text="Reset", width=80, command=perf.reset).pack(side="right")
+
+        box = ctk.CTkTextbox(win, font=("Courier New", 12), fg_color="#111111", text_color="#dddddd", wrap="none")
+        box.pack(fill="both", expand=True, padx=20, pady=6)
+        ctk.CTkButton(win, text="Close", command=win.destroy).pack(pady=12)
+
+        def refresh():
+            if not win.winfo_exists():
+                return
+            box.configure(state="normal")
+            box.delete("1.0", "end")
+            box.insert("1.0", self._metrics_text())
+            box.configure(state="disabled")
+            win.after(METRICS_REFRESH_MS, refresh)
+
+        refresh()
+
+    def _metrics_text(self):
+        """Gauges and span histograms shown in the settings window."""
+        cache = self.loaded_ctkimages
+        rss = perf.resident_memory()
+        lines = [
+            f"Resident memory  {rss / 2**20:.1f} MB" if rss else "Resident memory  n/a",
+            f"Widgets          {perf.widget_count(self)}",
+            f"Image cache      {cache.hit_rate() * 100:.0f}% hits ({cache.hits}/{cache.hits + cache.misses}), "
+            f"{len(cache)} images, {cache.current_bytes / 2**20:.1f} of {cache.max_bytes / 2**20:.0f} MB",
+            f"Poster queue     {self.poster_loader.pending() if self.poster_loader else 0} pending",
+            f"Catalog          {len(getattr(self, 'data_items', ()))} items",
+            f"Poster dedup     {self.poster_manifest.report() if self.poster_manifest else 'n/a'}",
+            "",
+        ]
+        stats = perf.histograms()
+        if not stats:
+            lines.append("No timings yet." if perf.ENABLED else "Timings are off (switch on \"Record timings\").")
+            return "\n".join(lines)
+        lines.append(f"{'span (ms)':<16}{'count':>7}{'mean':>9}{'p50':>9}{'p95':>9}{'max':>9}  "
+                     f"histogram {perf.BUCKETS_MS[0]:g} ms .. {perf.BUCKETS_MS[-1]:g} ms+")
+        for name, (count, mean, p50, p95, top, buckets) in sorted(stats.items()):
+            peak = max(buckets)
+            bars = "".join(_BARS[n * (len(_BARS) - 1) // peak] if n else " " for n in buckets)
+            lines.append(f"{name:<16}{count:>7}{mean:>9.2f}{p50:>9.2f}{p95:>9.2f}{top:>9.1f}  |{bars}|")
+        return "\n".join(lines)
 
     def _logout(self):
         """Logout: hide main window and show login again."""
@@ -343,8 +665,11 @@ class MovieApp(ctk.CTk):
         # Optional background
         if os.path.exists("bgimage.jpg"):
             try:
-                bg_image = Image.open("bgimage.jpg")
-                bg = ctk.CTkImage(bg_image, size=(1600, 900))
+                if self._login_bg is None:
+                    # scaled once and reused by every login window (see _logout)
+                    from thumbcache import load_background
+                    self._login_bg = ctk.CTkImage(load_background("bgimage.jpg", (1600, 900)), size=(1600, 900))
+                bg = self._login_bg
                 bg_label = ctk.CTkLabel(self.login_win, image=bg, text="")
                 bg_label.place(relx=0.5, rely=0.5, anchor="center")
                 # store reference to avoid GC
@@ -397,16 +722,148 @@ class MovieApp(ctk.CTk):
                 self.login_win.destroy()
         except Exception:
             pass
+        self._build_main()   # normally done already while the login window was up
         self.deiconify()
         # show home content
         self.show_home()
+        perf.mark_when_idle(self, "first grid")
 
     # ----------------- Content management -----------------
+    def _poster_image(self, path, size):
+        """Return a CTkImage for `path` at `size`, decoded once and kept in the LRU image cache."""
+        from thumbcache import load_thumbnail
+        path = self.poster_manifest.canonical(path)
+        return self.loaded_ctkimages.get_or_create(
+            (path, size),
+            lambda: ctk.CTkImage(load_thumbnail(path, size), size=size),
+            image_nbytes(size),
+        )
+
+    def _poster_placeholder(self, size):
+        """Shared plain image shown while a poster is still decoding."""
+        if size not in self._placeholders:
+            from PIL import Image
+            self._placeholders[size] = ctk.CTkImage(Image.new("RGB", size, "#2b2b2b"), size=size)
+        return self._placeholders[size]
+
+    def _has_poster(self, path):
+        """True if `path` can be shown: packed in the atlas (no stat needed) or on disk."""
+        if not path:
+            return False
+        return (self.poster_atlas is not None and path in self.poster_atlas) or os.path.exists(path)
+
+    def _add_poster_label(self, parent, path, size):
+        """Create the poster label for a card on the page being built (see _set_poster)."""
+        lbl = ctk.CTkLabel(parent, text="")
+        self._set_poster(lbl, path, size, group=self._build_page)
+        return lbl
+
+    def _set_poster(self, lbl, path, size, group=None):
+        """
+        Point `lbl` at the poster `path`. Cached images are shown at once;
+        otherwise a placeholder is shown and the decode runs on the poster pool.
+        Safe to call again on the same label (recycled cards): a decode still
+        pending for the previous poster is cancelled. `group` tags the decode so it
+        can be cancelled together with the page it belongs to.
+        """
+        canon = self.poster_manifest.canonical(path)   # duplicate posters share one decode / cache entry
+        alias = canon != path
+        path = canon
+        key = (path, size)
+        self.poster_loader.cancel(getattr(lbl, "_poster_token", None))
+        lbl._poster_key = key
+        lbl._poster_token = None
+
+        cached = self.loaded_ctkimages.get(key)
+        if cached is not None and alias:
+            self.poster_manifest.record_hit("image cache")
+        if cached is None and self.poster_atlas is not None:
+            # packed thumbnail: a slice of the mapped atlas, no file open or decode
+            atlas_img = self.poster_atlas.get(path, size)
+            if atlas_img is not None:
+                cached = self.loaded_ctkimages.put(key, ctk.CTkImage(atlas_img, size=size), image_nbytes(size))
+        if cached is not None:
+            lbl.configure(image=cached, text="")
+            return
+        if not path or not os.path.exists(path):
+            lbl.configure(image=self._poster_placeholder(size), text="No Image",
+                          font=("Arial", 14), text_color="gray")
+            return
+        lbl.configure(image=self._poster_placeholder(size), text="")
+        if alias:
+            from thumbcache import has_thumbnail
+            if has_thumbnail(path, size):
+                self.poster_manifest.record_hit("thumbnail")
+
+        def on_ready(pil_img):
+            if not lbl.winfo_exists() or lbl._poster_key != key:
+                return
+            lbl._poster_token = None
+            if pil_img is None:
+                lbl.configure(text="No Image", font=("Arial", 14), text_color="gray")
+                return
+            ctk_img = self.loaded_ctkimages.put(key, ctk.CTkImage(pil_img, size=size), image_nbytes(size))
+            lbl.configure(image=ctk_img)
+
+        lbl._poster_token = self.poster_loader.request(path, size, on_ready, group=group)
+
     def clear_content_area(self):
+        """Hide cached view pages and destroy everything else in the content area."""
+        if self.card_builder.cancel():
+            # navigated away mid-build: don't keep the half-built page, the next visit rebuilds it
+            for view, page in list(self.view_frames.items()):
+                if page is self._build_page:
+                    del self.view_frames[view]
+        self._build_page = None
+        self._search_ids = None
+        self._grid_title = None
+        if self.virtual_grid.active:
+            self.poster_loader.cancel_group(None)
+            self.virtual_grid.hide()
+            self.canvas.itemconfigure(self.content_window, state="normal")
+        kept = set(self.view_frames.values())
         for w in self.content_frame.winfo_children():
-            w.destroy()
+            if w in kept:
+                w.pack_forget()
+            else:
+                # drop decodes for cards that are about to disappear
+                self.poster_loader.cancel_group(w)
+                w.destroy()
         self.image_refs.clear()
 
+    def _new_page(self, view=None):
+        """Create the frame a view is built into. Named views are kept alive in view_frames."""
+        page = ctk.CTkFrame(self.content_frame, fg_color="#121212")
+        page.pack(fill="both", expand=True)
+        if view:
+            self.view_frames[view] = page
+        self._build_page = page
+        return page
+
+    def _raise_view(self, view):
+        """Show the cached page for `view` if there is one. Returns False when it must be built."""
+        page = self.view_frames.get(view)
+        if page is None or not page.winfo_exists():
+            self.view_frames.pop(view, None)
+            return False
+        if page is self._build_page and self.card_builder.active:
+            return True   # already on screen and still being built: let the build finish
+        self.clear_content_area()
+        if not page.winfo_exists():
+            return False  # a build was cancelled and its page dropped: rebuild
+        page.pack(fill="both", expand=True)
+        self.canvas.yview_moveto(0)
+        return True
+
+    def invalidate_views(self, *views):
+        """Drop cached pages whose data changed (all of them when called without names)."""
+        for view in views or list(self.view_frames):
+            page = self.view_frames.pop(view, None)
+            # a page on screen stays until the next navigation clears it
+            if page is not None and page.winfo_exists() and not page.winfo_ismapped():
+                self.poster_loader.cancel_group(page)
+                page.destroy()
+
     def show_home(self):
         """Show main homepage with movie and series sections (grid)."""
         self.current_filter = None
@@ -416,137 +873,140 @@ class MovieApp(ctk.CTk):
                 self.search_entry.delete(0, "end")
         except Exception:
             pass
-        self.filtered_data = list(self.data_items)
-        self.populate_home_sections()
+        self.filtered_data = self.data_items
+        self._reset_facet_filters()
+        if not self._raise_view(self._cacheable("home")):
+            self.populate_home_sections()
 
     def show_movies_only(self):
         self.current_filter = "movie"
-        self.filtered_data = [m for m in self.data_items if str(m.get("type", "")).lower() == "movie"]
-        self.populate_grid(self.filtered_data, "Movies")
+        self.filtered_data = self._view_items(type="movie")
+        self._reset_facet_filters()
+        if not self._raise_view(self._cacheable("movies")):
+            self.populate_grid(self.filtered_data, self._sorted_title("Movies"), view=self._cacheable("movies"))
 
     def show_series_only(self):
         self.current_filter = "web series"
-        self.filtered_data = [m for m in self.data_items if "series" in str(m.get("type", "")).lower()]
-        self.populate_grid(self.filtered_data, "Web Series")
+        self.filtered_data = self._view_items(type="series")
+        self._reset_facet_filters()
+        if not self._raise_view(self._cacheable("series")):
+            self.populate_grid(self.filtered_data, self._sorted_title("Web Series"), view=self._cacheable("series"))
 
     def populate_home_sections(self):
         """Create two big sections: Movies and Web Series — use grid layout similar to earlier code."""
         self.clear_content_area()
 
-        movies = [m for m in self.data_items if str(m.get("type", "")).lower() == "movie"]
-        series = [m for m in self.data_items if "series" in str(m.get("type", "")).lower()]
+        movies = self._view_items(type="movie")
+        series = self._view_items(type="series")
+
+        if len(movies) + len(series) > VIRTUAL_GRID_THRESHOLD:
+            with perf.span("populate_home_sections"):
+                self._show_virtual_grid([(t, i) for t, i in (("Movies", movies), ("Web Series", series)) if i])
+            return
+        page = self._new_page(self._cacheable("home"))
+        cols = 7
+        for col in range(cols):
+            page.grid_columnconfigure(col, weight=1, uniform="col")
+
+        def add_header(title, row):
+            lbl = ctk.CTkLabel(page, text=title, font=("Arial", 26, "bold"), text_color="white")
+            lbl.grid(row=row, column=0, sticky="w", pady=(18, 8), padx=10, columnspan=cols)
+
+        def add_card(item, row, col):
+            card = ctk.CTkFrame(page, fg_color="#222222", corner_radius=12)
+            card.grid(row=row, column=col, padx=8, pady=8, sticky="nsew")
+
+            # poster
+            poster_path = item.poster
+            if self._has_poster(poster_path):
+                self._add_poster_label(card, poster_path, (160, 250)).pack(pady=(10, 6))
+            else:
+                ctk.CTkLabel(card, text="No Image", font=("Arial", 14), text_color="gray").pack(pady=40)
+
+            # title and info
+            ctk.CTkLabel(card, text=item.title, font=("Arial", 14, "bold"), text_color="white",
+                         wraplength=160, justify="center").pack(pady=(4, 6))
+            info_txt = item.info_text
+            ctk.CTkLabel(card, text=info_txt, font=("Arial", 11), text_color="#bbbbbb").pack()
+
+            genres_txt = item.genres_text
+            ctk.CTkLabel(card, text=genres_txt, font=("Arial", 10), text_color="#999999",
+                         wraplength=160, justify="center").pack(pady=(3, 6))
+
+            desc = item.description
+            if len(desc) > 100:
+                desc = desc[:97] + "..."
+            ctk.CTkLabel(card, text=desc, font=("Arial", 11), text_color="#dddddd",
+                         wraplength=160, justify="left").pack(padx=8, pady=(0, 8))
+
+            # bottom buttons: play + watchlist
+            btns = ctk.CTkFrame(card, fg_color="transparent")
+            btns.pack(pady=(4, 10))
+            play_btn = ctk.CTkButton(btns, text="▶ Play Now", width=45, height=34, fg_color="#e50914",
+                                     hover_color="#b20710", corner_radius=16,
+                                     font=("Arial", 12, "bold"),
+                                     command=lambda i=item: self.show_trailer_window(i))
+            play_btn.pack(side="left", padx=4)
 
-        def add_section(title, items, start_row):
+            wl_btn = ctk.CTkButton(btns, text=" ➕Watchlist", width=50, height=34, fg_color="#2b2b2b",
+                                   hover_color="#3b3b3b", corner_radius=16,
+                                   font=("Arial", 12), command=lambda it=item: self.toggle_watchlist(it))
+            wl_btn.pack(side="left", padx=4)
+
+        # grid positions are fixed up front, so cards can be built a slice at a time, top rows first
+        steps = []
+        row = 0
+        for title, items in (("Movies", movies), ("Web Series", series)):
             if not items:
-                return start_row
-            lbl = ctk.CTkLabel(self.content_frame, text=title, font=("Arial", 26, "bold"), text_color="white")
-            lbl.grid(row=start_row, column=0, sticky="w", pady=(18, 8), padx=10, columnspan=7)
-            start_row += 1
-
-            cols = 7
-            col_num = 0
-
-            for col in range(cols):
-                self.content_frame.grid_columnconfigure(col, weight=1, uniform="col")
-
-            for item in items:
-                card = ctk.CTkFrame(self.content_frame, fg_color="#222222", corner_radius=12)
-                card.grid(row=start_row, column=col_num, padx=8, pady=8, sticky="nsew")
-
-                # poster
-                poster_path = item.get("poster", "")
-                if poster_path and os.path.exists(poster_path):
-                    try:
-                        pil_img = Image.open(poster_path).resize((160, 250))
-                        ctk_img = ctk.CTkImage(pil_img, size=(160, 250))
-                        lbl_img = ctk.CTkLabel(card, image=ctk_img, text="")
-                        lbl_img.pack(pady=(10, 6))
-                        # keep reference
-                        self.image_refs.append(ctk_img)
-                    except Exception:
-                        ctk.CTkLabel(card, text="No Image", font=("Arial", 14), text_color="gray").pack(pady=40)
-                else:
-                    ctk.CTkLabel(card, text="No Image", font=("Arial", 14), text_color="gray").pack(pady=40)
-
-                # title and info
-                ctk.CTkLabel(card, text=item.get("title", "Untitled"), font=("Arial", 14, "bold"), text_color="white",
-                             wraplength=160, justify="center").pack(pady=(4, 6))
-                info_txt = f"{item.get('year','')} | ⭐ {item.get('rating','')} | {item.get('language','')}"
-                ctk.CTkLabel(card, text=info_txt, font=("Arial", 11), text_color="#bbbbbb").pack()
-
-                genres_txt = ", ".join(item.get("genres", []))
-                ctk.CTkLabel(card, text=genres_txt, font=("Arial", 10), text_color="#999999",
-                             wraplength=160, justify="center").pack(pady=(3, 6))
-
-                desc = item.get("description", "No description available.")
-                if len(desc) > 100:
-                    desc = desc[:97] + "..."
-                ctk.CTkLabel(card, text=desc, font=("Arial", 11), text_color="#dddddd",
-                             wraplength=160, justify="left").pack(padx=8, pady=(0, 8))
-
-                # bottom buttons: play + watchlist
-                btns = ctk.CTkFrame(card, fg_color="transparent")
-                btns.pack(pady=(4, 10))
-                play_btn = ctk.CTkButton(btns, text="▶ Play Now", width=45, height=34, fg_color="#e50914",
-                                         hover_color="#b20710", corner_radius=16,
-                                         font=("Arial", 12, "bold"),
-                                         command=lambda i=item: self.show_trailer_window(i))
-                play_btn.pack(side="left", padx=4)
-
-                wl_btn = ctk.CTkButton(btns, text=" ➕Watchlist", width=50, height=34, fg_color="#2b2b2b",
-                                       hover_color="#3b3b3b", corner_radius=16,
-                                       font=("Arial", 12), command=lambda it=item: self.toggle_watchlist(it))
-                wl_btn.pack(side="left", padx=4)
-
-                col_num += 1
-                if col_num >= cols:
-                    col_num = 0
-                    start_row += 1
-            return start_row + 1
-
-        r = 0
-        r = add_section("Movies", movies, r)
-        r = add_section("Web Series", series, r)
-
-    def populate_grid(self, items, title):
-        """Populate a grid view for a list of items (used for lists like movies or search)."""
+                continue
+            steps.append(partial(add_header, title, row))
+            row += 1
+            for n, item in enumerate(items):
+                steps.append(partial(add_card, item, row + n // cols, n % cols))
+            row += -(-len(items) // cols) + 1
+        # header + first row before the next frame; timed until the last card is built
+        self.card_builder.start(steps, first=cols + 1, name="populate_home_sections")
+
+    def populate_grid(self, items, title, view=None):
+        """
+        Populate a grid view for a list of items (used for lists like movies or search).
+        Pass `view` to keep the built page alive for the next visit (see _raise_view).
+        Cards are built in frame-sized slices (see card_builder.ChunkedBuilder).
+        """
         self.clear_content_area()
-        lbl = ctk.CTkLabel(self.content_frame, text=title, font=("Arial", 26, "bold"), text_color="white")
+        if len(items) > VIRTUAL_GRID_THRESHOLD:
+            with perf.span("populate_grid"):
+                self._show_virtual_grid([(title, items)])
+            return
+        page = self._new_page(view)
+        lbl = ctk.CTkLabel(page, text=title, font=("Arial", 26, "bold"), text_color="white")
         lbl.grid(row=0, column=0, sticky="w", pady=(20, 8), padx=10, columnspan=7)
+        self._grid_title = lbl
 
         cols = 7
-        row = 1
-        col_num = 0
         for col in range(cols):
-            self.content_frame.grid_columnconfigure(col, weight=1, uniform="col")
+            page.grid_columnconfigure(col, weight=1, uniform="col")
 
-        for item in items:
-            card = ctk.CTkFrame(self.content_frame, fg_color="#222222", corner_radius=12)
-            card.grid(row=row, column=col_num, padx=8, pady=8, sticky="nsew")
+        def add_card(item, row, col):
+            card = ctk.CTkFrame(page, fg_color="#222222", corner_radius=12)
+            card.grid(row=row, column=col, padx=8, pady=8, sticky="nsew")
 
-            poster_path = item.get("poster", "")
-            if poster_path and os.path.exists(poster_path):
-                try:
-                    pil_img = Image.open(poster_path).resize((160, 250))
-                    ctk_img = ctk.CTkImage(pil_img, size=(160, 250))
-                    lbl_img = ctk.CTkLabel(card, image=ctk_img, text="")
-                    lbl_img.pack(pady=(10, 6))
-                    self.image_refs.append(ctk_img)
-                except Exception:
-                    ctk.CTkLabel(card, text="No Image", font=("Arial", 14), text_color="gray").pack(pady=40)
+            poster_path = item.poster
+            if self._has_poster(poster_path):
+                self._add_poster_label(card, poster_path, (160, 250)).pack(pady=(10, 6))
             else:
                 ctk.CTkLabel(card, text="No Image", font=("Arial", 14), text_color="gray").pack(pady=40)
 
-            ctk.CTkLabel(card, text=item.get("title", "Untitled"), font=("Arial", 14, "bold"), text_color="white",
+            ctk.CTkLabel(card, text=item.title, font=("Arial", 14, "bold"), text_color="white",
                          wraplength=160, justify="center").pack(pady=(6, 6))
-            info_txt = f"{item.get('year','')} | ⭐ {item.get('rating','')} | {item.get('language','')}"
+            info_txt = item.info_text
             ctk.CTkLabel(card, text=info_txt, font=("Arial", 11), text_color="#bbbbbb").pack()
 
-            genres_txt = ", ".join(item.get("genres", []))
+            genres_txt = item.genres_text
             ctk.CTkLabel(card, text=genres_txt, font=("Arial", 10), text_color="#999999",
                          wraplength=160, justify="center").pack(pady=(3, 6))
 
-            desc = item.get("description", "No description available.")
+            desc = item.description
             if len(desc) > 100:
                 desc = desc[:97] + "..."
             ctk.CTkLabel(card, text=desc, font=("Arial", 11), text_color="#dddddd",
@@ -565,37 +1025,184 @@ class MovieApp(ctk.CTk):
                                    font=("Arial", 12), command=lambda it=item: self.toggle_watchlist(it))
             wl_btn.pack(side="left", padx=6)
 
-            col_num += 1
-            if col_num >= cols:
-                col_num = 0
-                row += 1
+        steps = [partial(add_card, item, 1 + n // cols, n % cols) for n, item in enumerate(items)]
+        # first row before the next frame; timed until the last card is built
+        self.card_builder.start(steps, first=cols, name="populate_grid")
+
+    # ----------------- Facet filters (genre / language) -----------------
+    def _view_items(self, **criteria):
+        """
+        Items matching facet criteria (see FacetIndex.filter), in the order picked
+        in the sort menu and already cut to the top N for the top-N modes.
+        """
+        mode = SORT_MODES.get(self.sort_var.get())
+        if self.columns is not None:
+            # large catalog: vectorized masks over the column copy
+            mask = self.columns.mask(**criteria)
+            if mode is None:
+                ids = self.columns.ids(mask)
+            else:
+                key, reverse, limit = mode
+                ids = self.columns.top(key, limit, mask, reverse=reverse)
+            return [self.data_items[i] for i in ids]
+        if mode is None:
+            ids = self.facets.select(**criteria)
+        else:
+            key, reverse, limit = mode
+            ids = self.sorts.top(key, limit, self.facets.filter(**criteria), reverse=reverse)
+        return [self.data_items[i] for i in ids]
+
+    def _cacheable(self, view):
+        """Only pages in catalog order are kept alive (sorted pages are cheap to rebuild)."""
+        return view if SORT_MODES.get(self.sort_var.get()) is None else None
+
+    def _sorted_title(self, title):
+        if SORT_MODES.get(self.sort_var.get()) is None:
+            return title
+        return f"{title} · {self.sort_var.get()}"
+
+    def _facet_choice(self, facet):
+        var = self.genre_var if facet == "genre" else self.language_var
+        return self._facet_labels[facet].get(var.get())
+
+    def _type_facet(self):
+        return {"movie": "movie", "web series": "series"}.get(self.current_filter)
+
+    def _refresh_facet_menus(self):
+        """Rebuild menu entries with counts for the current type and the other menu's choice."""
+        genre = self._facet_choice("genre")
+        language = self._facet_choice("language")
+        base = self.facets.filter(type=self._type_facet())
+        for facet, var, menu, all_label, other in (
+                ("genre", self.genre_var, self.genre_menu, ALL_GENRES, {"language": language}),
+                ("language", self.language_var, self.language_menu, ALL_LANGUAGES, {"genre": genre})):
+            counts = self.facets.counts(facet, self.facets.filter(base, **other))
+            labels = {f"{value} ({n})": value for value, n in sorted(counts.items())}
+            labels[all_label] = None
+            self._facet_labels[facet] = labels
+            menu.configure(values=[all_label] + [l for l in labels if l != all_label])
+            chosen = genre if facet == "genre" else language
+            var.set(next((l for l, v in labels.items() if v == chosen and v is not None), all_label))
+
+    def _reset_facet_filters(self):
+        if self.genre_var.get() != ALL_GENRES or self.language_var.get() != ALL_LANGUAGES:
+            self.genre_var.set(ALL_GENRES)
+            self.language_var.set(ALL_LANGUAGES)
+        self._refresh_facet_menus()
+
+    def apply_facet_filters(self, *_):
+        genre = self._facet_choice("genre")
+        language = self._facet_choice("language")
+        self._refresh_facet_menus()
+        if genre is None and language is None:
+            {"movie": self.show_movies_only, "web series": self.show_series_only}.get(
+                self.current_filter, self.show_home)()
+            return
+        self.filtered_data = self._view_items(type=self._type_facet(), genre=genre, language=language)
+        title = " · ".join(x for x in (genre, language) if x)
+        self.populate_grid(self.filtered_data, self._sorted_title(f"Filtered: {title}"))
+
+    # ----------------- Virtualized grid (large views) -----------------
+    def _show_virtual_grid(self, sections):
+        """Show `sections` [(title, items)] with the recycled card pool instead of one widget set per item."""
+        self.canvas.itemconfigure(self.content_window, state="hidden")
+        self.virtual_grid.show(sections)
+
+    def _make_virtual_header(self, parent, title):
+        return ctk.CTkLabel(parent, text=title, font=("Arial", 26, "bold"), text_color="white",
+                            fg_color="#121212", anchor="w", padx=10)
+
+    def _make_virtual_card(self, parent):
+        """Build one empty card with the same layout as populate_grid; filled in by _bind_virtual_card."""
+        card = ctk.CTkFrame(parent, fg_color="#222222", corner_radius=12)
+        card.poster_lbl = ctk.CTkLabel(card, text="")
+        card.poster_lbl.pack(pady=(10, 6))
+        card.title_lbl = ctk.CTkLabel(card, text="", font=("Arial", 14, "bold"), text_color="white",
+                                      wraplength=160, justify="center")
+        card.title_lbl.pack(pady=(6, 6))
+        card.info_lbl = ctk.CTkLabel(card, text="", font=("Arial", 11), text_color="#bbbbbb")
+        card.info_lbl.pack()
+        card.genres_lbl = ctk.CTkLabel(card, text="", font=("Arial", 10), text_color="#999999",
+                                       wraplength=160, justify="center")
+        card.genres_lbl.pack(pady=(3, 6))
+        card.desc_lbl = ctk.CTkLabel(card, text="", font=("Arial", 11), text_color="#dddddd",
+                                     wraplength=160, justify="left")
+        card.desc_lbl.pack(padx=8, pady=(0, 8))
+
+        btn_frame = ctk.CTkFrame(card, fg_color="transparent")
+        btn_frame.pack(pady=(4, 8))
+        card.play_btn = ctk.CTkButton(btn_frame, text="▶ Play Now", width=120, height=34, fg_color="#e50914",
+                                      hover_color="#b20710", corner_radius=16,
+                                      font=("Arial", 12, "bold"))
+        card.play_btn.pack(side="left", padx=6)
+        card.wl_btn = ctk.CTkButton(btn_frame, text="＋ Watchlist", width=120, height=34, fg_color="#2b2b2b",
+                                    hover_color="#3b3b3b", corner_radius=16, font=("Arial", 12))
+        card.wl_btn.pack(side="left", padx=6)
+        return card
+
+    def _bind_virtual_card(self, card, item):
+        self._set_poster(card.poster_lbl, item.poster, (160, 250))
+        card.title_lbl.configure(text=item.title)
+        card.info_lbl.configure(text=item.info_text)
+        card.genres_lbl.configure(text=item.genres_text)
+        desc = item.description
+        if len(desc) > 100:
+            desc = desc[:97] + "..."
+        card.desc_lbl.configure(text=desc)
+        card.play_btn.configure(command=lambda i=item: self.show_trailer_window(i))
+        card.wl_btn.configure(command=lambda it=item: self.toggle_watchlist(it))
 
     # ----------------- Watchlist -----------------
     def toggle_watchlist(self, item):
-        titles = [x.get("title") for x in self.watchlist]
-        if item.get("title") in titles:
+        titles = [x.title for x in self.watchlist]
+        if item.title in titles:
             # remove
-            self.watchlist = [x for x in self.watchlist if x.get("title") != item.get("title")]
-            safe_showinfo("Watchlist", f"Removed from watchlist: {item.get('title')}")
+            self.watchlist = [x for x in self.watchlist if x.title != item.title]
+            safe_showinfo("Watchlist", f"Removed from watchlist: {item.title}")
         else:
             self.watchlist.append(item)
-            safe_showinfo("Watchlist", f"Added to watchlist: {item.get('title')}")
+            safe_showinfo("Watchlist", f"Added to watchlist: {item.title}")
+        self.invalidate_views("watchlist")
 
     def show_watchlist(self):
+        if self._raise_view("watchlist"):
+            return
         if not self.watchlist:
             self.clear_content_area()
-            ctk.CTkLabel(self.content_frame, text="⭐ Your Watchlist is empty", font=("Arial", 20), text_color="gray").pack(pady=30)
+            page = self._new_page("watchlist")
+            ctk.CTkLabel(page, text="⭐ Your Watchlist is empty", font=("Arial", 20), text_color="gray").pack(pady=30)
             return
-        self.populate_grid(self.watchlist, "⭐ Your Watchlist")
+        self.populate_grid(self.watchlist, "⭐ Your Watchlist", view="watchlist")
 
     # ----------------- Search -----------------
+    def _schedule_search(self):
+        """Debounce keystrokes: run the search once typing pauses for SEARCH_DEBOUNCE_MS."""
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(SEARCH_DEBOUNCE_MS, self.on_search_change)
+
+    @perf.timed("search")
     def on_search_change(self):
-        query = self.search_var.get().strip().lower()
+        self._search_after_id = None
+        query = self.search_var.get().strip()
+        title = f"Search Results for '{query}'"
         if query == "":
-            self.show_home()
-        else:
-            self.filtered_data = [m for m in self.data_items if query in str(m.get("title","")).lower()]
-            self.populate_grid(self.filtered_data, f"Search Results for '{query}'")
+            if self._search_ids is not None:
+                self.show_home()
+            return
+        ids = self.search_cache.search(query)
+        if self.fuzzy_var.get() and len(query) >= FUZZY_MIN_QUERY:
+            # exact substring hits always come first; fuzzy only adds near-miss spellings after them
+            exact = set(ids)
+            ids = ids + tuple(i for i in self.fuzzy_index.search(query, k=FUZZY_TOP_K) if i not in exact)
+        if ids == self._search_ids:
+            # same results as on screen: only the header changes
+            if self._grid_title is not None:
+                self._grid_title.configure(text=title)
+                return
+        self.filtered_data = [self.data_items[i] for i in ids]
+        self.populate_grid(self.filtered_data, title)
+        self._search_ids = ids
 
     def clear_search(self):
         try:
@@ -613,7 +1220,7 @@ class MovieApp(ctk.CTk):
         try:
             trailer_win = ctk.CTkToplevel(self)
             trailer_win.geometry("900x520")
-            trailer_win.title(f"Details - {movie.get('title','Details')}")
+            trailer_win.title(f"Details - {movie.title}")
             trailer_win.configure(fg_color="#1c1c1c")
             trailer_win.grab_set()  # Modal window
 
@@ -622,10 +1229,9 @@ class MovieApp(ctk.CTk):
             left_frame.pack(side="left", padx=20, pady=20)
             left_frame.pack_propagate(False)
 
-            if movie.get("poster") and os.path.exists(movie.get("poster")):
+            if movie.poster and os.path.exists(movie.poster):
                 try:
-                    img = Image.open(movie["poster"]).resize((330, 480))
-                    photo = ctk.CTkImage(img, size=(330, 480))
+                    photo = self._poster_image(movie.poster, (330, 480))
                     lbl_img = ctk.CTkLabel(left_frame, image=photo, text="")
                     lbl_img.image = photo  # keep reference
                     lbl_img.pack(pady=10)
@@ -640,12 +1246,12 @@ class MovieApp(ctk.CTk):
             right_frame.grid_rowconfigure(2, weight=1)  # Make description expand
 
             # Title & info
-            ctk.CTkLabel(right_frame, text=movie.get("title", ""), font=("Arial", 26, "bold"), text_color="white").grid(row=0, column=0, sticky="w", padx=20, pady=(20,8))
+            ctk.CTkLabel(right_frame, text=movie.title, font=("Arial", 26, "bold"), text_color="white").grid(row=0, column=0, sticky="w", padx=20, pady=(20,8))
             info_text = (
-                f"Year: {movie.get('year','N/A')}\n"
-                f"Rating: ⭐ {movie.get('rating','N/A')}\n"
-                f"Language: {movie.get('language','N/A')}\n"
-                f"Genres: {', '.join(movie.get('genres', []))}"
+                f"Year: {movie.year}\n"
+                f"Rating: ⭐ {movie.rating}\n"
+                f"Language: {movie.language_text}\n"
+                f"Genres: {movie.genres_text}"
             )
             ctk.CTkLabel(right_frame, text=info_text, font=("Arial", 13), text_color="#cccccc", justify="left").grid(row=1, column=0, sticky="w", padx=20, pady=(0,10))
 
@@ -653,7 +1259,7 @@ class MovieApp(ctk.CTk):
             desc_frame = ctk.CTkFrame(right_frame, fg_color="#333333", corner_radius=10)
             desc_frame.grid(row=2, column=0, sticky="nsew", padx=20, pady=(0, 20))
             desc_text = tk.Text(desc_frame, wrap="word", font=("Arial", 13), bg="#333333", fg="white", bd=0, padx=12, pady=12)
-            desc_text.insert("1.0", movie.get("description", "No description available."))
+            desc_text.insert("1.0", movie.description)
             desc_text.configure(state="disabled")
             desc_text.pack(side="left", fill="both", expand=True)
             desc_scroll = tk.Scrollbar(desc_frame, command=desc_text.yview)
@@ -665,8 +1271,9 @@ class MovieApp(ctk.CTk):
             btn_frame.grid(row=3, column=0, sticky="e", padx=20, pady=10)
 
             def open_trailer():
-                url = movie.get("trailer_url") or movie.get("trailer") or movie.get("url")
+                url = movie.trailer_url or movie.get("trailer") or movie.get("url")
                 if url:
+                    import webbrowser
                     webbrowser.open(url)
                 else:
                     ctk.CTkLabel(right_frame, text="Trailer URL not available.", font=("Arial", 12), text_color="red").grid(row=4, column=0, sticky="w", padx=20)
@@ -688,8 +1295,15 @@ class MovieApp(ctk.CTk):
         except Exception as e:
             print("Error opening trailer window:", e)
 
+    def destroy(self):
+        if self.poster_loader is not None:
+            self.poster_loader.shutdown()
+        super().destroy()
+
     # ----------------- Scrolling helpers -----------------
     def on_content_configure(self, event):
+        if self.virtual_grid.active:
+            return  # scrollregion is owned by the virtual grid
         try:
             self.canvas.configure(scrollregion=self.canvas.bbox("all"))
             self.canvas.itemconfigure(self.content_window, width=self.canvas.winfo_width())
@@ -699,12 +1313,18 @@ class MovieApp(ctk.CTk):
     def on_canvas_configure(self, event):
         try:
             self.canvas.itemconfigure(self.content_window, width=event.width)
+            self.virtual_grid.refresh()
         except Exception:
             pass
 
+    def on_scrollbar(self, *args):
+        self.canvas.yview(*args)
+        self.virtual_grid.refresh()
+
     def on_mousewheel(self, event):
         try:
             self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+            self.virtual_grid.refresh()
         except Exception:
             pass
 
@@ -0,0 +1,438 @@
+# facets.py
+from bisect import bisect_left, bisect_right, insort
+from functools import partial
+import heapq
+from itertools import compress, groupby, islice
+from operator import itemgetter
+
+from catalog import CatalogItem, canonical_language, canonical_type, clean_genres, fold
+
+
+# ----------------- Value extractors for data.json items -----------------
+def as_list(value):
+    """Facet fields may hold one value or a list (e.g. "language": ["Hindi", "English"])."""
+    if isinstance(value, (list, tuple, set)):
+        return list(value)
+    return [value] if value not in (None, "") else []
+
+
+# CatalogItem records are normalized when loaded; plain dicts (store rows,
+# watchlist entries) go through the same rules here.
+def type_values(item):
+    if isinstance(item, CatalogItem):
+        return [item.type]
+    return [canonical_type(item.get("type"))]
+
+
+def genre_values(item):
+    if isinstance(item, CatalogItem):
+        return list(item.genres)
+    return clean_genres(as_list(item.get("genres")))
+
+
+def language_values(item):
+    if isinstance(item, CatalogItem):
+        return list(item.languages)
+    return list(dict.fromkeys(canonical_language(l) for l in as_list(item.get("language")) if str(l).strip()))
+
+
+def _number(key, item):
+    try:
+        return float(item.get(key))
+    except (TypeError, ValueError):
+        return None
+
+
+def number_value(key):
+    # a partial (not a closure), so indexes built with it stay picklable
+    return partial(_number, key)
+
+
+def title_key(item):
+    if isinstance(item, CatalogItem):
+        return item.title_key
+    return fold(item.get("title", ""))
+
+
+CATALOG_FACETS = {"type": type_values, "genre": genre_values, "language": language_values}
+CATALOG_RANGES = {"year": number_value("year"), "rating": number_value("rating")}
+CATALOG_SORTS = {"rating": number_value("rating"), "year": number_value("year"), "title": title_key}
+
+
+# ----------------- Bitmap helpers -----------------
+def popcount(bitmap):
+    try:
+        return bitmap.bit_count()          # Python 3.10+
+    except AttributeError:
+        return bin(bitmap).count("1")
+
+
+_BITS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def bitmap_ids(bitmap):
+    """Ascending doc ids of the bits set in `bitmap` (decoded through bin(), not bit by bit)."""
+    if not bitmap:
+        return []
+    bits = bin(bitmap)[:1:-1].encode("ascii").translate(_BITS)   # bit i -> byte i, 0 or 1
+    return list(compress(range(len(bits)), bits))
+
+
+def bitmap_from_ids(ids):
+    """Bitmap with the bits of `ids` set, built in one go (no big-int reallocation per id)."""
+    if not ids:
+        return 0
+    buf = bytearray((max(ids) >> 3) + 1)
+    for d in ids:
+        buf[d >> 3] |= 1 << (d & 7)
+    return int.from_bytes(buf, "little")
+
+
+class FacetIndex:
+    """
+    Precomputed filter index over catalog items, built once at load time.
+    Docs are small ints (positions in the item list). Every discrete facet value
+    (type / genre / language) owns an int bitmap; numeric fields (year / rating)
+    keep a sorted array of distinct values with one bitmap per value, so a range
+    is a bisect plus a few ORs. Filters combine by bitwise AND, and per-value
+    counts are popcounts — nothing rescans the items.
+
+        ix = FacetIndex(items)
+        bm = ix.filter(type="movie", genre=["Drama", "Romance"], year=(2010, None))
+        items_shown = [items[i] for i in ix.ids(bm)]
+        ix.counts("genre", bm)   # {"Drama": 12, ...}
+
+    Bulk loads go through `add_many()`: doc ids are only collected per value,
+    and each bitmap is built once (bitmap_from_ids) when it is next read.
+    `add()` ORs a single doc in for later incremental changes. `select()`
+    returns ids directly; single-value filters (the Movies / Web Series views)
+    are served from an id array kept next to that value's bitmap.
+    """
+
+    def __init__(self, items=(), facets=None, ranges=None):
+        self.facets = CATALOG_FACETS if facets is None else facets
+        self.ranges = CATALOG_RANGES if ranges is None else ranges
+        self._all = 0
+        self._bitmaps = {name: {} for name in self.facets}         # facet -> value -> bitmap
+        self._range_bitmaps = {name: {} for name in self.ranges}   # field -> number -> bitmap
+        self._range_keys = {name: [] for name in self.ranges}      # field -> sorted distinct numbers
+        self._doc_values = {}                                      # doc id -> values (for remove)
+        self._pending = []                                         # doc ids from add_many() not in the bitmaps yet
+        self._ids = {}                                             # (facet, value) or None (all) -> ascending ids
+        self.add_many(enumerate(items))
+
+    def __len__(self):
+        return len(self._doc_values)
+
+    @property
+    def all(self):
+        self.flush()
+        return self._all
+
+    # ----------------- Updates -----------------
+    def add_many(self, docs):
+        """Add (doc id, item) pairs in bulk; their bits are set together on the next read (see flush)."""
+        for doc_id, item in docs:
+            if doc_id in self._doc_values:
+                self.remove(doc_id)
+            values = {name: set(extract(item)) for name, extract in self.facets.items()}
+            for name, extract in self.ranges.items():
+                values[name] = extract(item)
+            self._doc_values[doc_id] = values
+            self._pending.append(doc_id)
+
+    def flush(self):
+        """Build the bitmaps of docs added with add_many(): one bitmap per value, each created once."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        self._ids.clear()
+        facet_ids = {name: {} for name in self.facets}
+        range_ids = {name: {} for name in self.ranges}
+        for doc_id in pending:
+            values = self._doc_values.get(doc_id)
+            if values is None:
+                continue
+            for name in self.facets:
+                ids = facet_ids[name]
+                for v in values[name]:
+                    ids.setdefault(v, []).append(doc_id)
+            for name in self.ranges:
+                v = values[name]
+                if v is not None:
+                    range_ids[name].setdefault(v, []).append(doc_id)
+        self._all |= bitmap_from_ids(pending)
+        for name, by_value in facet_ids.items():
+            table = self._bitmaps[name]
+            for v, ids in by_value.items():
+                table[v] = table.get(v, 0) | bitmap_from_ids(ids)
+        for name, by_value in range_ids.items():
+            table = self._range_bitmaps[name]
+            keys = self._range_keys[name]
+            for v, ids in by_value.items():
+                if v not in table:
+                    insort(keys, v)
+                    table[v] = 0
+                table[v] |= bitmap_from_ids(ids)
+
+    def add(self, doc_id, item):
+        self.flush()
+        if doc_id in self._doc_values:
+            self.remove(doc_id)
+        self._ids.clear()
+        bit = 1 << doc_id
+        self._all |= bit
+        values = {}
+        for name, extract in self.facets.items():
+            vals = set(extract(item))
+            values[name] = vals
+            table = self._bitmaps[name]
+            for v in vals:
+                table[v] = table.get(v, 0) | bit
+        for name, extract in self.ranges.items():
+            v = extract(item)
+            values[name] = v
+            if v is None:
+                continue
+            table = self._range_bitmaps[name]
+            if v not in table:
+                insort(self._range_keys[name], v)
+                table[v] = 0
+            table[v] |= bit
+        self._doc_values[doc_id] = values
+
+    def remove(self, doc_id):
+        self.flush()
+        values = self._doc_values.pop(doc_id, None)
+        if values is None:
+            return
+        self._ids.clear()
+        mask = ~(1 << doc_id)
+        self._all &= mask
+        for name in self.facets:
+            table = self._bitmaps[name]
+            for v in values[name]:
+                table[v] &= mask
+                if not table[v]:
+                    del table[v]
+        for name in self.ranges:
+            v = values[name]
+            if v is None:
+                continue
+            table = self._range_bitmaps[name]
+            table[v] &= mask
+            if not table[v]:
+                del table[v]
+                keys = self._range_keys[name]
+                del keys[bisect_left(keys, v)]
+
+    # ----------------- Queries -----------------
+    def values(self, facet):
+        self.flush()
+        return sorted(self._bitmaps[facet])
+
+    def bitmap(self, facet, value):
+        """Docs having `value` (or any of several values) for `facet`."""
+        self.flush()
+        table = self._bitmaps[facet]
+        if isinstance(value, (list, tuple, set)):
+            bm = 0
+            for v in value:
+                bm |= table.get(v, 0)
+            return bm
+        return table.get(value, 0)
+
+    def range_bitmap(self, field, lo=None, hi=None):
+        """Docs with lo <= field <= hi (either bound may be None)."""
+        self.flush()
+        keys = self._range_keys[field]
+        start = 0 if lo is None else bisect_left(keys, lo)
+        stop = len(keys) if hi is None else bisect_right(keys, hi)
+        table = self._range_bitmaps[field]
+        bm = 0
+        for v in keys[start:stop]:
+            bm |= table[v]
+        return bm
+
+    def filter(self, base=None, **criteria):
+        """
+        AND together facet criteria (value or list of values, OR-ed) and range
+        criteria ((lo, hi) tuples). None values are ignored. Returns a bitmap.
+        """
+        bm = self.all if base is None else base
+        for name, value in criteria.items():
+            if value is None:
+                continue
+            if name in self.ranges:
+                bm &= self.range_bitmap(name, *value)
+            else:
+                bm &= self.bitmap(name, value)
+            if not bm:
+                break
+        return bm
+
+    def counts(self, facet, bitmap=None):
+        """{value: number of docs in `bitmap` with that value}, zero counts left out."""
+        bm = self.all if bitmap is None else bitmap   # (flushes)
+        counts = {}
+        for value, vbm in self._bitmaps[facet].items():
+            n = popcount(vbm & bm)
+            if n:
+                counts[value] = n
+        return counts
+
+    def select(self, **criteria):
+        """
+        Ascending doc ids matching `criteria` (as in filter). No criteria or a
+        single facet value is answered from the id array of that value, decoded
+        once and reused until the index changes, so treat the list as read-only.
+        """
+        self.flush()
+        given = [(name, value) for name, value in criteria.items() if value is not None]
+        if not given:
+            key = None
+        elif len(given) == 1 and given[0][0] in self.facets and not isinstance(given[0][1], (list, tuple, set)):
+            key = given[0]
+        else:
+            return bitmap_ids(self.filter(**criteria))
+        ids = self._ids.get(key)
+        if ids is None:
+            bm = self._all if key is None else self._bitmaps[key[0]].get(key[1], 0)
+            ids = self._ids[key] = bitmap_ids(bm)
+        return ids
+
+    @staticmethod
+    def ids(bitmap):
+        return bitmap_ids(bitmap)
+
+
+class SortIndex:
+    """
+    Precomputed sort orders (permutations of doc ids) for the catalog views.
+    Each order is a sorted list of (key, doc id) kept valid with bisect on
+    add/remove, so nothing is re-sorted per click. Docs without a key always
+    come last, and equal keys keep catalog order in either direction (as in
+    ColumnarCatalog.top). `top()` combines an order with a FacetIndex bitmap: selective
+    filters use heap selection over the matching docs, broad ones walk the
+    precomputed order until `n` matches are found.
+
+    Bulk loads go through `add_many()`, which appends unsorted; each order is
+    sorted once, on the next read (see flush). `add()` keeps the orders valid
+    with insort for later single-item changes.
+    """
+
+    def __init__(self, items=(), keys=None):
+        self.keys = CATALOG_SORTS if keys is None else keys
+        self._orders = {name: [] for name in self.keys}     # name -> sorted [(key, doc id)]
+        self._missing = {name: [] for name in self.keys}    # name -> doc ids without a key
+        self._doc_keys = {}                                 # doc id -> {name: key}
+        self._unsorted = False                              # add_many() appended since the last sort
+        self.add_many(enumerate(items))
+
+    def __len__(self):
+        return len(self._doc_keys)
+
+    def add_many(self, docs):
+        """Add (doc id, item) pairs in bulk; the orders are sorted once on the next read."""
+        for doc_id, item in docs:
+            if doc_id in self._doc_keys:
+                self.remove(doc_id)
+            keys = {}
+            for name, extract in self.keys.items():
+                k = extract(item)
+                keys[name] = k
+                if k is None:
+                    self._missing[name].append(doc_id)
+                else:
+                    self._orders[name].append((k, doc_id))
+            self._doc_keys[doc_id] = keys
+            self._unsorted = True
+
+    def flush(self):
+        if not self._unsorted:
+            return
+        for name in self.keys:
+            order = self._orders[name]
+            # by id, then (stable) by key: same result as sorting the tuples, about twice as fast
+            order.sort(key=itemgetter(1))
+            order.sort(key=itemgetter(0))
+            self._missing[name].sort()
+        self._unsorted = False
+
+    def add(self, doc_id, item):
+        self.flush()
+        if doc_id in self._doc_keys:
+            self.remove(doc_id)
+        keys = {}
+        for name, extract in self.keys.items():
+            k = extract(item)
+            keys[name] = k
+            if k is None:
+                insort(self._missing[name], doc_id)
+            else:
+                insort(self._orders[name], (k, doc_id))
+        self._doc_keys[doc_id] = keys
+
+    def remove(self, doc_id):
+        self.flush()
+        keys = self._doc_keys.pop(doc_id, None)
+        if keys is None:
+            return
+        for name, k in keys.items():
+            if k is None:
+                seq, entry = self._missing[name], doc_id
+            else:
+                seq, entry = self._orders[name], (k, doc_id)
+            pos = bisect_left(seq, entry)
+            if pos < len(seq) and seq[pos] == entry:
+                del seq[pos]
+
+    def _walk(self, name, reverse):
+        """Doc ids with a key in `name` order; equal keys stay in catalog order both ways."""
+        order = self._orders[name]
+        if not reverse:
+            return (doc_id for _, doc_id in order)
+        return (doc_id for _, group in groupby(reversed(order), key=lambda pair: pair[0])
+                for _, doc_id in reversed(list(group)))
+
+    def order(self, name, reverse=False):
+        """All doc ids sorted by `name`."""
+        self.flush()
+        pairs = self._orders[name]
+        if reverse:
+            pairs = sorted(pairs, key=itemgetter(0), reverse=True)   # stable, so ties stay in id order
+        return [doc_id for _, doc_id in pairs] + self._missing[name]
+
+    def top(self, name, n=None, bitmap=None, reverse=False):
+        """
+        First `n` doc ids (all when n is None) by `name`, restricted to the docs
+        set in `bitmap` (a FacetIndex bitmap) when given.
+        """
+        self.flush()
+        if bitmap is None:
+            if n is None:
+                return self.order(name, reverse)
+            ids = list(islice(self._walk(name, reverse), n))
+            return ids + self._missing[name][:n - len(ids)]
+
+        allowed = set(bitmap_ids(bitmap))
+        order = self._orders[name]
+        if n is not None and len(allowed) * 8 < len(order):
+            # selective filter: heap-select among the few matching docs
+            keyed = [(self._doc_keys[d][name], d) for d in allowed if self._doc_keys[d][name] is not None]
+            if reverse:
+                picked = heapq.nlargest(n, keyed, key=lambda pair: (pair[0], -pair[1]))
+            else:
+                picked = heapq.nsmallest(n, keyed)
+            ids = [d for _, d in picked]
+        else:
+            # broad filter: walk the precomputed order
+            ids = []
+            for d in self._walk(name, reverse):
+                if d in allowed:
+                    ids.append(d)
+                    if n is not None and len(ids) >= n:
+                        return ids
+        if n is None or len(ids) < n:
+            ids += [d for d in self._missing[name] if d in allowed]
+        return ids if n is None else ids[:n]
@@ -0,0 +1,76 @@
+# image_cache.py
+from collections import OrderedDict
+
+# Default memory budget for decoded images (bytes)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def image_nbytes(size, channels=4):
+    """Rough in-memory cost of a decoded image of `size` (w, h)."""
+    return int(size[0]) * int(size[1]) * channels
+
+
+class ImageCache:
+    """
+    Bounded LRU cache for decoded images (CTkImage / PhotoImage / PIL images).
+    Entries are keyed by anything hashable, usually (poster path, size).
+    When the total byte estimate exceeds `max_bytes` the least recently used
+    entries are dropped.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()   # key -> (value, nbytes)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get(self, key, default=None):
+        entry = self._items.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self._items.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, value, nbytes):
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.current_bytes -= old[1]
+        self._items[key] = (value, nbytes)
+        self.current_bytes += nbytes
+        self._evict()
+        return value
+
+    def get_or_create(self, key, factory, nbytes):
+        """Return the cached value for `key`, building it with `factory()` on a miss."""
+        value = self.get(key)
+        if value is None:
+            value = self.put(key, factory(), nbytes)
+        return value
+
+    def discard(self, key):
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.current_bytes -= old[1]
+
+    def clear(self):
+        self._items.clear()
+        self.current_bytes = 0
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def _evict(self):
+        # always keep the newest entry even if it alone is over budget
+        while self.current_bytes > self.max_bytes and len(self._items) > 1:
+            _, (_, nbytes) = self._items.popitem(last=False)
+            self.current_bytes -= nbytes
@@ -0,0 +1,171 @@
+# journal.py
+import hashlib
+import json
+import os
+import threading
+
+# Compact once the log grows past this many bytes
+COMPACT_THRESHOLD = 256 * 1024
+
+
+def _digest(data):
+    return hashlib.sha1(data).hexdigest()
+
+
+def _write_atomic(path, text):
+    """Write `text` to `path` via a temp file + rename, so a crash never leaves half a file."""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(text.encode("utf-8"))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def apply_record(movies, rec):
+    """Apply one journal record to the in-memory list (same effect as the UI action)."""
+    op = rec.get("op")
+    if op == "add":
+        movies.append(rec["movie"])
+    elif op == "delete":
+        index = rec["index"]
+        if 0 <= index < len(movies):
+            movies.pop(index)
+    elif op == "watched":
+        index = rec["index"]
+        if 0 <= index < len(movies):
+            movies[index]["watched"] = True
+
+
+class Journal:
+    """
+    Snapshot + append-only mutation log for the watchlist.
+
+    `snapshot_path` holds the full list (same format as before) and is only ever
+    replaced atomically. Each add / delete / mark-watched is appended as one JSON
+    line to `log_path`, so a click costs O(1) disk I/O instead of re-dumping the
+    whole list. The log starts with a header naming the hash of the snapshot it
+    applies to; `load()` replays it only on top of that snapshot, and a torn last
+    line (crash mid-append) is ignored.
+
+    When the log passes `threshold` bytes, the list is compacted into a new
+    snapshot on a background thread. Records logged meanwhile are carried over
+    into the new log (written as `<log>.next` before the snapshot is swapped), so
+    a crash at any point leaves a snapshot/log pair that replays correctly.
+    """
+
+    def __init__(self, snapshot_path, log_path=None, threshold=COMPACT_THRESHOLD):
+        self.snapshot_path = snapshot_path
+        self.log_path = log_path or snapshot_path + ".log"
+        self.next_log_path = self.log_path + ".next"
+        self.threshold = threshold
+        self._base = None            # hash of the snapshot the current log applies to
+        self._lock = threading.Lock()
+        self._compactor = None
+
+    # ----------------- Reading -----------------
+    @staticmethod
+    def _read_log(path):
+        """Return (base hash, [records], torn) or None if `path` is missing or has no header."""
+        if not os.path.exists(path):
+            return None
+        records = []
+        torn = False
+        with open(path, "r", encoding="utf-8") as f:
+            try:
+                base = json.loads(f.readline())["base"]
+            except (ValueError, KeyError, TypeError):
+                return None
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    torn = True  # crash mid-append: drop the partial last line
+                    break
+        return base, records, torn
+
+    def load(self):
+        raw = b""
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, "rb") as f:
+                raw = f.read()
+        movies = json.loads(raw.decode("utf-8")) if raw.strip() else []
+        self._base = _digest(raw)
+        torn = False
+
+        for path in (self.log_path, self.next_log_path):
+            log = self._read_log(path)
+            if log is None or log[0] != self._base:
+                continue
+            for rec in log[1]:
+                apply_record(movies, rec)
+            torn = log[2]
+            if path == self.next_log_path:
+                # compaction was interrupted after swapping the snapshot: finish it
+                os.replace(self.next_log_path, self.log_path)
+            break
+        else:
+            # no log matches this snapshot (first run, or a stale one): start fresh
+            if os.path.exists(self.log_path):
+                os.remove(self.log_path)
+        if os.path.exists(self.next_log_path):
+            os.remove(self.next_log_path)
+        if torn:
+            # don't append after a partial line: fold everything into a fresh snapshot
+            self.compact(movies)
+        return movies
+
+    # ----------------- Writing -----------------
+    def _header(self, base):
+        return json.dumps({"base": base}) + "\n"
+
+    def append(self, rec, movies=None):
+        """Log one mutation. Pass the current list to allow background compaction."""
+        line = json.dumps(rec, ensure_ascii=False) + "\n"
+        if self._base is None:
+            self.load()
+        with self._lock:
+            new = not os.path.exists(self.log_path)
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                if new:
+                    f.write(self._header(self._base))
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            size = os.path.getsize(self.log_path)
+        if movies is not None and size > self.threshold:
+            self.compact_async(movies)
+
+    def compact(self, movies, offset=None):
+        """
+        Write `movies` as the new snapshot. Log records past byte `offset` (those
+        appended after `movies` was copied) are kept in the new log.
+        """
+        text = json.dumps(movies, indent=2)
+        base = _digest(text.encode("utf-8"))
+        with self._lock:
+            tail = []
+            if offset is not None and os.path.exists(self.log_path):
+                with open(self.log_path, "rb") as f:
+                    f.seek(offset)
+                    for line in f:
+                        try:
+                            rec = json.loads(line)
+                        except ValueError:
+                            break
+                        if "op" in rec:
+                            tail.append(line.decode("utf-8").rstrip("\r\n") + "\n")
+            _write_atomic(self.next_log_path, self._header(base) + "".join(tail))
+            _write_atomic(self.snapshot_path, text)
+            os.replace(self.next_log_path, self.log_path)
+            self._base = base
+
+    def compact_async(self, movies):
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+        with self._lock:
+            offset = os.path.getsize(self.log_path) if os.path.exists(self.log_path) else 0
+        # copy on the caller's (Tk) thread so later clicks don't race the dump
+        snapshot = [dict(m) for m in movies]
+        self._compactor = threading.Thread(target=self.compact, args=(snapshot, offset), daemon=True)
+        self._compactor.start()
@@ -2,20 +2,36 @@ import tkinter as tk
 from tkinter import *
 from tkinter import messagebox, ttk
 from PIL import Image, ImageTk
-import json, os
+from search_index import NgramIndex
+from facets import FacetIndex
+from journal import Journal
+from thumbcache import load_background
 
 FILE = "movies.json"
 
-# Load data
+# movies.json is the snapshot; each click is appended to movies.json.log
+journal = Journal(FILE)
+
+# Load data (snapshot + replayed log)
 def load_movies():
-    if os.path.exists(FILE):
-        with open(FILE, "r") as f:
-            return json.load(f)
-    return []
+    return journal.load()
+
+# Substring index over "title + category" (doc ids are id() of the movie dicts)
+search_index = NgramIndex()
+
+def index_key(m):
+    return m.get("title", "") + "\x00" + m.get("category", "")
 
-def save_movies():
-    with open(FILE, "w") as f:
-        json.dump(movies, f, indent=2)
+# Bitmap index for the sidebar filters (doc ids are positions in `movies`)
+WATCHLIST_FACETS = {
+    "category": lambda m: [m.get("category", "").lower()],
+    "watched": lambda m: [bool(m.get("watched", False))],
+}
+facet_index = FacetIndex(facets=WATCHLIST_FACETS, ranges={})
+
+def rebuild_facets():
+    global facet_index
+    facet_index = FacetIndex(movies, facets=WATCHLIST_FACETS, ranges={})
 
 # ---------------------
 # Movie operations
@@ -23,8 +39,11 @@ def save_movies():
 def add_movie(event=None):
     title = title_var.get().strip()
     if title:
-        movies.append({"title": title, "category": "", "watched": False})
-        save_movies()
+        movie = {"title": title, "category": "", "watched": False}
+        movies.append(movie)
+        search_index.add(id(movie), index_key(movie))
+        facet_index.add(len(movies) - 1, movie)
+        journal.append({"op": "add", "movie": movie}, movies)
         title_var.set("")
         update_list()
     else:
@@ -35,8 +54,9 @@ def delete_movie():
     if selected:
         index = int(selected[0])
         if 0 <= index < len(movies):
-            movies.pop(index)
-            save_movies()
+            search_index.remove(id(movies.pop(index)))
+            rebuild_facets()  # positions after `index` shifted
+            journal.append({"op": "delete", "index": index}, movies)
             update_list()
         else:
             messagebox.showerror("Error", "Selection index out of range.")
@@ -49,7 +69,8 @@ def mark_watched():
         index = int(selected[0])
         if 0 <= index < len(movies):
             movies[index]["watched"] = True
-            save_movies()
+            facet_index.add(index, movies[index])
+            journal.append({"op": "watched", "index": index}, movies)
             update_list()
         else:
             messagebox.showerror("Error", "Selection index out of range.")
@@ -59,27 +80,27 @@ def mark_watched():
 # ---------------------
 # Filtering
 # ---------------------
-current_filter = None
+current_filter = None   # facet criteria for facet_index.filter(), e.g. {"watched": False}
 
-def apply_filter(filter_fn=None):
+def apply_filter(criteria=None):
     global current_filter
-    current_filter = filter_fn
+    current_filter = criteria
     update_list()
 
 def show_all():
     apply_filter(None)
 
 def show_continue_watchlist():
-    apply_filter(lambda m: not m.get("watched", False))
+    apply_filter({"watched": False})
 
 def show_history():
-    apply_filter(lambda m: m.get("watched", False))
+    apply_filter({"watched": True})
 
 def show_suggestions():
-    apply_filter(lambda m: not m.get("watched", False))
+    apply_filter({"watched": False})
 
 def show_category(cat_name):
-    apply_filter(lambda m: m.get("category", "").lower() == cat_name.lower())
+    apply_filter({"category": cat_name.lower()})
 
 # ---------------------
 # UI update
@@ -87,13 +108,13 @@ def show_category(cat_name):
 def update_list(*args):
     filter_text = search_var.get().strip().lower()
     tree.delete(*tree.get_children())
-    for i, m in enumerate(movies):
+    matched = search_index.search(filter_text) if filter_text else None
+    for i in facet_index.select(**(current_filter or {})):
+        m = movies[i]
         title = m.get("title", "")
         category = m.get("category", "")
         watched = m.get("watched", False)
-        if current_filter and not current_filter(m):
-            continue
-        if filter_text and filter_text not in title.lower() and filter_text not in category.lower():
+        if matched is not None and id(m) not in matched:
             continue
         status = "✅" if watched else "❌"
         tree.insert("", "end", iid=i, values=(title, category, status))
@@ -138,7 +159,7 @@ root.configure(bg="#0D1D28")
 top = Toplevel()
 top.title("LOGIN - MovieMAX")
 
-bg_image = Image.open("bgimage.jpg")
+bg_image = load_background("bgimage.jpg")
 bg_photo = ImageTk.PhotoImage(bg_image)
 bg_label = Label(top, image=bg_photo)
 bg_label.place(x=0, y=0, relwidth=1, relheight=1)
@@ -240,6 +261,9 @@ for text, cmd in nav_buttons:
 title_var = tk.StringVar()
 search_var = tk.StringVar()
 movies = load_movies()
+for m in movies:
+    search_index.add(id(m), index_key(m))
+rebuild_facets()
 
 input_frame = tk.Frame(main_frame, bg="#0D1D28")
 input_frame.pack(padx=10, pady=(8, 6), fill="x")
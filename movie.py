@@ -1,9 +1,22 @@
+import perf   # first, so the startup marks include the imports below
 import customtkinter as ctk
 import tkinter as tk
-from PIL import Image
-import json
 import os
-import webbrowser
+import threading
+# PIL, webbrowser and the poster decoder are imported where first needed (after login)
+from image_cache import ImageCache, image_nbytes
+from virtual_grid import VirtualGrid
+from search_index import NgramIndex, QueryCache
+from catalog import iter_catalog
+
+# Memory budget for decoded poster images shared by all views (bytes)
+IMAGE_CACHE_BYTES = 96 * 1024 * 1024
+
+# Views with more items than this use the windowed (recycled) grid
+VIRTUAL_GRID_THRESHOLD = 150
+
+# Search waits this long after the last keystroke before rebuilding the grid (ms)
+SEARCH_DEBOUNCE_MS = 250
 
 def clear_email_placeholder(event):
     if email_entry.get() == "Email or phone number":
@@ -27,25 +40,54 @@ def on_login():
         return
 
     login_window.destroy()
+    app.build()      # normally done already while the login window was up
     app.deiconify()  # Show the main app window
+    perf.mark_when_idle(app, "first grid")
 
 def load_data():
+    # items are parsed and normalized one at a time (no whole-file json.load + copies)
     if os.path.exists("data.json"):
-        with open("data.json", "r") as f:
-            return json.load(f)
+        return list(iter_catalog("data.json"))
     return []
 
 class MovieApp(ctk.CTk):
-    def __init__(self):
+    def __init__(self, build=True):
         super().__init__()
         self.title("📽️MovieMAX")
         self.geometry("1200x800")
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("dark-blue")
 
+        self.poster_loader = None
+        self.poster_manifest = None
+        self.built = False
+        if build:
+            self.build()
+
+    def build(self):
+        """Load the catalog and create the widgets (deferred until after the login window is up)."""
+        if self.built:
+            return
+        self.built = True
+        from poster_loader import PosterLoader   # imports PIL
         self.data = load_data()
-        self.filtered_data = self.data.copy()
+        self.filtered_data = self.data
+        self.title_index = NgramIndex()
+        for i, m in enumerate(self.data):
+            self.title_index.add(i, m.title_key)
+        self.search_cache = QueryCache(self.title_index)
+        self.search_after_id = None
+        self.search_ids = None
         self.image_refs = []
+        self.image_cache = ImageCache(IMAGE_CACHE_BYTES)
+        self.poster_loader = PosterLoader(self)
+        from poster_atlas import PosterAtlas
+        self.poster_atlas = PosterAtlas.open()   # packed 160x250 thumbnails, None if not built
+        from poster_manifest import PosterManifest
+        self.poster_manifest = PosterManifest()   # duplicate poster files -> one canonical path
+        threading.Thread(target=self.poster_manifest.refresh, args=([m.poster for m in self.data],),
+                         daemon=True).start()
+        self.placeholders = {}
         
 
         self.current_filter = None
@@ -77,7 +119,7 @@ class MovieApp(ctk.CTk):
         search_frame.pack(fill="x", padx=20, pady=(10,0))
 
         self.search_var = ctk.StringVar()
-        self.search_var.trace_add("write", self.on_search_change)
+        self.search_var.trace_add("write", self.schedule_search)
 
         self.search_entry = ctk.CTkEntry(search_frame, placeholder_text="Search movies & series...",
                                          textvariable=self.search_var,
@@ -100,7 +142,7 @@ class MovieApp(ctk.CTk):
         self.canvas = tk.Canvas(container, bg="#121212", highlightthickness=0)
         self.canvas.pack(side="left", fill="both", expand=True)
 
-        v_scrollbar = tk.Scrollbar(container, orient="vertical", command=self.canvas.yview)
+        v_scrollbar = tk.Scrollbar(container, orient="vertical", command=self.on_scrollbar)
         v_scrollbar.pack(side="right", fill="y")
 
         self.canvas.configure(yscrollcommand=v_scrollbar.set)
@@ -113,45 +155,122 @@ class MovieApp(ctk.CTk):
 
         self.bind_all("<MouseWheel>", self.on_mousewheel)
 
+        self.virtual_grid = VirtualGrid(self.canvas, self.make_virtual_card, self.bind_virtual_card,
+                                        make_header=self.make_virtual_header, cols=7)
+
     def clear_search(self):
         self.search_var.set("")
         self.show_home()
 
+    def schedule_search(self, *args):
+        # debounce: only search once typing pauses
+        if self.search_after_id is not None:
+            self.after_cancel(self.search_after_id)
+        self.search_after_id = self.after(SEARCH_DEBOUNCE_MS, self.on_search_change)
+
     def on_search_change(self, *args):
-        query = self.search_var.get().strip().lower()
+        self.search_after_id = None
+        query = self.search_var.get().strip()
         if query == "":
-            self.show_home()
-        else:
-            self.filtered_data = [m for m in self.data if query in m["title"].lower()]
-            self.populate_grid(self.filtered_data, "Search Results")
+            if self.search_ids is not None:
+                self.show_home()
+            return
+        ids = self.search_cache.search(query)
+        if ids == self.search_ids:
+            return  # results on screen are already right
+        self.filtered_data = [self.data[i] for i in ids]
+        self.populate_grid(self.filtered_data, "Search Results")
+        self.search_ids = ids
 
     def show_home(self):
         self.current_filter = None
         self.search_var.set("")
-        self.filtered_data = self.data.copy()
+        self.filtered_data = self.data
         self.populate_home_sections()
 
     def show_movies_only(self):
         self.current_filter = "movie"
         self.search_var.set("")
-        movies = [m for m in self.data if m["type"].lower() == "movie"]
+        movies = [m for m in self.data if m.type == "movie"]
         self.populate_grid(movies, "Movies")
 
     def show_series_only(self):
         self.current_filter = "web series"
         self.search_var.set("")
-        series = [m for m in self.data if m["type"].lower() == "web series"]
+        series = [m for m in self.data if m.type == "series"]
         self.populate_grid(series, "Web Series")
 
+    def poster_image(self, path, size):
+        from thumbcache import load_thumbnail
+        path = self.poster_manifest.canonical(path)
+        return self.image_cache.get_or_create(
+            (path, size),
+            lambda: ctk.CTkImage(light_image=load_thumbnail(path, size), size=size),
+            image_nbytes(size),
+        )
+
+    def poster_label(self, parent, path, size):
+        lbl = ctk.CTkLabel(parent, text="")
+        self.set_poster(lbl, path, size)
+        return lbl
+
+    def has_poster(self, path):
+        return (self.poster_atlas is not None and path in self.poster_atlas) or os.path.exists(path)
+
+    def set_poster(self, lbl, path, size):
+        # cached posters show at once, the rest get a placeholder until the pool decodes them
+        path = self.poster_manifest.canonical(path)   # duplicate posters share one decode / cache entry
+        key = (path, size)
+        self.poster_loader.cancel(getattr(lbl, "poster_token", None))
+        lbl.poster_key = key
+        lbl.poster_token = None
+
+        if size not in self.placeholders:
+            from PIL import Image
+            self.placeholders[size] = ctk.CTkImage(light_image=Image.new("RGB", size, "#2b2b2b"), size=size)
+        photo = self.image_cache.get(key)
+        if photo is None and self.poster_atlas is not None:
+            atlas_img = self.poster_atlas.get(path, size)   # slice of the mapped atlas, no decode
+            if atlas_img is not None:
+                photo = self.image_cache.put(key, ctk.CTkImage(light_image=atlas_img, size=size), image_nbytes(size))
+        if photo is None and not os.path.exists(path):
+            lbl.configure(image=self.placeholders[size], text="No Image", font=("Arial", 14), text_color="gray")
+            return
+        if photo is not None:
+            lbl.configure(image=photo, text="")
+            return
+        lbl.configure(image=self.placeholders[size], text="")
+
+        def on_ready(img):
+            if not lbl.winfo_exists() or lbl.poster_key != key:
+                return
+            lbl.poster_token = None
+            if img is None:
+                lbl.configure(text="No Image", font=("Arial", 14), text_color="gray")
+                return
+            photo = self.image_cache.put(key, ctk.CTkImage(light_image=img, size=size), image_nbytes(size))
+            lbl.configure(image=photo)
+
+        lbl.poster_token = self.poster_loader.request(path, size, on_ready)
+
     def clear_content(self):
+        self.poster_loader.cancel_all()
+        self.search_ids = None
+        if self.virtual_grid.active:
+            self.virtual_grid.hide()
+            self.canvas.itemconfigure(self.content_window, state="normal")
         for widget in self.content_frame.winfo_children():
             widget.destroy()
         self.image_refs.clear()
 
     def populate_home_sections(self):
         self.clear_content()
-        movies = [m for m in self.data if m["type"].lower() == "movie"]
-        series = [m for m in self.data if m["type"].lower() == "web series"]
+        movies = [m for m in self.data if m.type == "movie"]
+        series = [m for m in self.data if m.type == "series"]
+
+        if len(movies) + len(series) > VIRTUAL_GRID_THRESHOLD:
+            self.show_virtual_grid([(t, i) for t, i in (("Movies", movies), ("Web Series", series)) if i])
+            return
 
         def add_section(title, items, start_row):
             if not items:
@@ -170,26 +289,23 @@ class MovieApp(ctk.CTk):
                 card = ctk.CTkFrame(self.content_frame, fg_color="#222222", corner_radius=15)
                 card.grid(row=start_row, column=col_num, padx=8, pady=8, sticky="nsew")
 
-                if os.path.exists(item["poster"]):
-                    img = Image.open(item["poster"]).resize((160, 250))
-                    photo = ctk.CTkImage(light_image=img, size=(160, 250))
-                    self.image_refs.append(photo)
-                    lbl_img = ctk.CTkLabel(card, image=photo, text="")
+                if self.has_poster(item.poster):
+                    lbl_img = self.poster_label(card, item.poster, (160, 250))
                     lbl_img.pack(pady=(10, 5))
                 else:
                     ctk.CTkLabel(card, text="No Image", font=("Arial", 14), text_color="gray").pack(pady=40)
 
-                ctk.CTkLabel(card, text=item["title"], font=("Arial", 14, "bold"), text_color="white",
+                ctk.CTkLabel(card, text=item.title, font=("Arial", 14, "bold"), text_color="white",
                              wraplength=160, justify="center").pack(pady=(0, 5))
 
-                info_txt = f"{item['year']} | ⭐ {item['rating']} | {item['language']}"
+                info_txt = item.info_text
                 ctk.CTkLabel(card, text=info_txt, font=("Arial", 11), text_color="#bbbbbb").pack()
 
-                genres_txt = ", ".join(item["genres"])
+                genres_txt = item.genres_text
                 ctk.CTkLabel(card, text=genres_txt, font=("Arial", 10), text_color="#999999",
                              wraplength=160, justify="center").pack(pady=(3, 7))
 
-                desc = item.get("description", "No description available.")
+                desc = item.description
                 if len(desc) > 100:
                     desc = desc[:97] + "..."
                 ctk.CTkLabel(card, text=desc, font=("Arial", 11), text_color="#dddddd",
@@ -213,6 +329,9 @@ class MovieApp(ctk.CTk):
 
     def populate_grid(self, items, title):
         self.clear_content()
+        if len(items) > VIRTUAL_GRID_THRESHOLD:
+            self.show_virtual_grid([(title, items)])
+            return
         lbl = ctk.CTkLabel(self.content_frame, text=title, font=("Arial", 26, "bold"), text_color="white")
         lbl.grid(row=0, column=0, sticky="w", pady=(20, 10), padx=10, columnspan=7)
 
@@ -227,26 +346,23 @@ class MovieApp(ctk.CTk):
             card = ctk.CTkFrame(self.content_frame, fg_color="#222222", corner_radius=15)
             card.grid(row=row, column=col_num, padx=8, pady=8, sticky="nsew")
 
-            if os.path.exists(item["poster"]):
-                img = Image.open(item["poster"]).resize((160, 250))
-                photo = ctk.CTkImage(light_image=img, size=(160, 250))
-                self.image_refs.append(photo)
-                lbl_img = ctk.CTkLabel(card, image=photo, text="")
+            if self.has_poster(item.poster):
+                lbl_img = self.poster_label(card, item.poster, (160, 250))
                 lbl_img.pack(pady=(10, 5))
             else:
                 ctk.CTkLabel(card, text="No Image", font=("Arial", 14), text_color="gray").pack(pady=40)
 
-            ctk.CTkLabel(card, text=item["title"], font=("Arial", 14, "bold"), text_color="white",
+            ctk.CTkLabel(card, text=item.title, font=("Arial", 14, "bold"), text_color="white",
                          wraplength=160, justify="center").pack(pady=(0, 5))
 
-            info_txt = f"{item['year']} | ⭐ {item['rating']} | {item['language']}"
+            info_txt = item.info_text
             ctk.CTkLabel(card, text=info_txt, font=("Arial", 11), text_color="#bbbbbb").pack()
 
-            genres_txt = ", ".join(item["genres"])
+            genres_txt = item.genres_text
             ctk.CTkLabel(card, text=genres_txt, font=("Arial", 10), text_color="#999999",
                          wraplength=160, justify="center").pack(pady=(3, 7))
 
-            desc = item.get("description", "No description available.")
+            desc = item.description
             if len(desc) > 100:
                 desc = desc[:97] + "..."
             ctk.CTkLabel(card, text=desc, font=("Arial", 11), text_color="#dddddd",
@@ -263,11 +379,52 @@ class MovieApp(ctk.CTk):
                 col_num = 0
                 row += 1
 
+    # windowed grid: a fixed pool of cards re-bound to items as the canvas scrolls
+    def show_virtual_grid(self, sections):
+        self.canvas.itemconfigure(self.content_window, state="hidden")
+        self.virtual_grid.show(sections)
+
+    def make_virtual_header(self, parent, title):
+        return ctk.CTkLabel(parent, text=title, font=("Arial", 26, "bold"), text_color="white",
+                            fg_color="#121212", anchor="w", padx=10)
+
+    def make_virtual_card(self, parent):
+        card = ctk.CTkFrame(parent, fg_color="#222222", corner_radius=15)
+        card.poster_lbl = ctk.CTkLabel(card, text="")
+        card.poster_lbl.pack(pady=(10, 5))
+        card.title_lbl = ctk.CTkLabel(card, text="", font=("Arial", 14, "bold"), text_color="white",
+                                      wraplength=160, justify="center")
+        card.title_lbl.pack(pady=(0, 5))
+        card.info_lbl = ctk.CTkLabel(card, text="", font=("Arial", 11), text_color="#bbbbbb")
+        card.info_lbl.pack()
+        card.genres_lbl = ctk.CTkLabel(card, text="", font=("Arial", 10), text_color="#999999",
+                                       wraplength=160, justify="center")
+        card.genres_lbl.pack(pady=(3, 7))
+        card.desc_lbl = ctk.CTkLabel(card, text="", font=("Arial", 11), text_color="#dddddd",
+                                     wraplength=160, justify="left")
+        card.desc_lbl.pack(padx=8, pady=(0, 10))
+        card.play_btn = ctk.CTkButton(card, text="▶ Play Now", width=140, height=35, fg_color="#e50914",
+                                      hover_color="#b20710", corner_radius=20,
+                                      font=("Arial", 13, "bold"))
+        card.play_btn.pack(pady=(5, 10))
+        return card
+
+    def bind_virtual_card(self, card, item):
+        self.set_poster(card.poster_lbl, item.poster, (160, 250))
+        card.title_lbl.configure(text=item.title)
+        card.info_lbl.configure(text=item.info_text)
+        card.genres_lbl.configure(text=item.genres_text)
+        desc = item.description
+        if len(desc) > 100:
+            desc = desc[:97] + "..."
+        card.desc_lbl.configure(text=desc)
+        card.play_btn.configure(command=lambda i=item: self.show_trailer_window(i))
+
     def show_trailer_window(self, movie):
         try:
             trailer_win = ctk.CTkToplevel(self)
             trailer_win.geometry("900x520")
-            trailer_win.title(f"Details - {movie['title']}")
+            trailer_win.title(f"Details - {movie.title}")
             trailer_win.configure(fg_color="#1c1c1c")
             trailer_win.grab_set()  # Modal window
 
@@ -276,9 +433,8 @@ class MovieApp(ctk.CTk):
             left_frame.pack(side="left", padx=20, pady=20)
             left_frame.pack_propagate(False)
 
-            if os.path.exists(movie.get("poster", "")):
-                img = Image.open(movie["poster"]).resize((330, 480))
-                photo = ctk.CTkImage(light_image=img, size=(330, 480))
+            if os.path.exists(movie.poster):
+                photo = self.poster_image(movie.poster, (330, 480))
                 lbl_img = ctk.CTkLabel(left_frame, image=photo, text="")
                 lbl_img.image = photo  # keep reference
                 lbl_img.pack(pady=10)
@@ -291,14 +447,14 @@ class MovieApp(ctk.CTk):
             right_frame.grid_rowconfigure(2, weight=1)  # Make description expand
 
             # Title
-            ctk.CTkLabel(right_frame, text=movie["title"], font=("Arial", 28, "bold"), text_color="white").grid(row=0, column=0, sticky="w", padx=20, pady=(20,8))
+            ctk.CTkLabel(right_frame, text=movie.title, font=("Arial", 28, "bold"), text_color="white").grid(row=0, column=0, sticky="w", padx=20, pady=(20,8))
 
             # Info labels
             info_text = (
-                f"Year: {movie['year']}\n"
-                f"Rating: ⭐ {movie['rating']}\n"
-                f"Language: {movie['language']}\n"
-                f"Genres: {', '.join(movie['genres'])}"
+                f"Year: {movie.year}\n"
+                f"Rating: ⭐ {movie.rating}\n"
+                f"Language: {movie.language_text}\n"
+                f"Genres: {movie.genres_text}"
             )
             ctk.CTkLabel(right_frame, text=info_text, font=("Arial", 15), text_color="#cccccc", justify="left").grid(row=1, column=0, sticky="w", padx=20, pady=(0,15))
 
@@ -307,7 +463,7 @@ class MovieApp(ctk.CTk):
             desc_frame.grid(row=2, column=0, sticky="nsew", padx=20, pady=(0, 20))
 
             desc_text = tk.Text(desc_frame, wrap="word", font=("Arial", 14), bg="#333333", fg="white", bd=0, padx=15, pady=15)
-            desc_text.insert("1.0", movie.get("description", "No description available."))
+            desc_text.insert("1.0", movie.description)
             desc_text.configure(state="disabled")
             desc_text.pack(side="left", fill="both", expand=True)
 
@@ -320,8 +476,9 @@ class MovieApp(ctk.CTk):
             btn_frame.grid(row=3, column=0, sticky="e", padx=20, pady=10)
 
             def open_trailer():
-                url = movie.get("trailer_url")
+                url = movie.trailer_url
                 if url:
+                    import webbrowser
                     webbrowser.open(url)
                 else:
                     ctk.CTkLabel(right_frame, text="Trailer URL not available.",
@@ -341,18 +498,31 @@ class MovieApp(ctk.CTk):
         except Exception as e:
             print("Error opening trailer window:", e)
 
+    def destroy(self):
+        if self.poster_loader is not None:
+            self.poster_loader.shutdown()
+        super().destroy()
+
     def on_content_configure(self, event):
+        if self.virtual_grid.active:
+            return
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
         self.canvas.itemconfigure(self.content_window, width=self.canvas.winfo_width())
 
     def on_canvas_configure(self, event):
         self.canvas.itemconfigure(self.content_window, width=event.width)
+        self.virtual_grid.refresh()
+
+    def on_scrollbar(self, *args):
+        self.canvas.yview(*args)
+        self.virtual_grid.refresh()
 
     def on_mousewheel(self, event):
         self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        self.virtual_grid.refresh()
 
 if __name__ == "__main__":
-    app = MovieApp()
+    app = MovieApp(build=False)
     app.withdraw()  # Hide main window initially
 
     # Login Window
@@ -363,13 +533,14 @@ if __name__ == "__main__":
 
     # Background image (optional)
     if os.path.exists("bgimage.jpg"):
-        bg_image = Image.open("bgimage.jpg")
-        bg = ctk.CTkImage(bg_image, size=(2000, 800))
+        from thumbcache import load_background
+        bg = ctk.CTkImage(load_background("bgimage.jpg", (2000, 800)), size=(2000, 800))
         bg_label = ctk.CTkLabel(login_window, image=bg, text="")
         bg_label.place(relx=0.5, rely=0.5, anchor="center")
 
     # Semi-transparent overlay (optional)
     if os.path.exists("overlay.png"):
+        from PIL import Image
         overlay_img = Image.open("overlay.png")
         overlay_ctk = ctk.CTkImage(light_image=overlay_img, size=(1000, 600))
         ctk.CTkLabel(login_window, image=overlay_ctk, text="").place(x=0, y=0)
@@ -395,4 +566,6 @@ if __name__ == "__main__":
     ctk.CTkLabel(frame, text="New to MovieMAX? Sign up now", font=("Arial", 10), text_color="white").pack()
     ctk.CTkLabel(frame, text="Protected by Google reCAPTCHA", font=("Arial", 8), text_color="gray").pack()
 
+    perf.mark_when_idle(app, "login window")
+    app.after_idle(app.build)   # catalog + main widgets load behind the login window
     app.mainloop()
@@ -0,0 +1,167 @@
+# perf.py
+from bisect import bisect_left
+from collections import deque
+from contextlib import nullcontext
+from functools import wraps
+import os
+import sys
+import threading
+import time
+
+# Process start as seen by the app: perf is the first module the frontends import
+START = time.perf_counter()
+
+_marks = {}   # milestone name -> seconds since START
+
+
+def mark(name):
+    """Record (once) and print how long after start `name` was reached, e.g. "login window"."""
+    if name in _marks:
+        return _marks[name]
+    elapsed = time.perf_counter() - START
+    _marks[name] = elapsed
+    print(f"[startup] {name}: {elapsed * 1000:.0f} ms")
+    return elapsed
+
+
+def marks():
+    return dict(_marks)
+
+
+def mark_when_idle(widget, name):
+    """Mark `name` once Tk has drawn what is pending (after_idle runs after the redraw)."""
+    widget.after_idle(lambda: mark(name))
+
+
+# ----------------- Instrumentation spans -----------------
+# Off by default: a disabled span / timed() call is one flag check. Turn on
+# with MOVIEMAX_METRICS=1 or from the metrics panel (Settings window).
+ENABLED = os.environ.get("MOVIEMAX_METRICS", "") not in ("", "0")
+
+# Histogram bucket upper bounds (ms); the last bucket takes everything slower
+BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+RECENT_SAMPLES = 512
+
+_histograms = {}   # span name -> Histogram
+_lock = threading.Lock()
+
+
+def enable(on=True):
+    global ENABLED
+    ENABLED = bool(on)
+
+
+class Histogram:
+    """Timings of one span: counts per BUCKETS_MS bucket plus the last RECENT_SAMPLES values for percentiles."""
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.recent = deque(maxlen=RECENT_SAMPLES)
+
+    def add(self, ms):
+        self.counts[bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+        self.recent.append(ms)
+
+    def percentile(self, p):
+        values = sorted(self.recent)
+        if not values:
+            return 0.0
+        return values[min(len(values) - 1, int(p / 100 * len(values)))]
+
+
+def record(name, ms):
+    """Add one timing (ms) to the histogram of `name`. Safe from worker threads."""
+    with _lock:
+        hist = _histograms.get(name)
+        if hist is None:
+            hist = _histograms[name] = Histogram()
+        hist.add(ms)
+
+
+class _Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record(self.name, (time.perf_counter() - self.start) * 1000)
+        return False
+
+
+_NO_SPAN = nullcontext()
+
+
+def span(name):
+    """`with perf.span("search"): ...` records the block's duration when metrics are on."""
+    return _Span(name) if ENABLED else _NO_SPAN
+
+
+def timed(name):
+    """Decorator form of span()."""
+    def wrap(fn):
+        @wraps(fn)
+        def call(*args, **kwargs):
+            if not ENABLED:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(name, (time.perf_counter() - start) * 1000)
+        return call
+    return wrap
+
+
+def histograms():
+    """{span name: (count, mean, p50, p95, max, bucket counts)}, a consistent copy."""
+    with _lock:
+        return {name: (h.count, h.total / h.count, h.percentile(50), h.percentile(95), h.max, list(h.counts))
+                for name, h in _histograms.items() if h.count}
+
+
+def reset():
+    with _lock:
+        _histograms.clear()
+
+
+# ----------------- Process gauges -----------------
+def resident_memory():
+    """Resident set size in bytes, or None where it can't be read cheaply."""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource   # peak rather than current, but better than nothing (macOS)
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss if sys.platform == "darwin" else rss * 1024
+    except ImportError:
+        return None
+
+
+def widget_count(widget):
+    """Number of Tk widgets under (and including) `widget`."""
+    count = 1
+    stack = list(widget.winfo_children())
+    while stack:
+        w = stack.pop()
+        count += 1
+        stack.extend(w.winfo_children())
+    return count
@@ -0,0 +1,183 @@
+# poster_atlas.py
+from PIL import Image
+import json
+import mmap
+import os
+import struct
+import threading
+
+from thumbcache import decode_poster
+
+# Atlas file (next to data.json) and the card size it holds
+ATLAS_FILE = ".posters.atlas"
+ATLAS_SIZE = (160, 250)
+
+_MAGIC = b"MMATLAS1"
+_HEADER = struct.Struct("<8sQ")   # magic, length of the JSON index that follows
+_ALIGN = 4096
+
+
+def _key(path):
+    return os.path.normcase(os.path.normpath(path))
+
+
+def build_atlas(paths, out=ATLAS_FILE, size=ATLAS_SIZE, canonical=None):
+    """
+    Pack `paths` (poster files) resized to `size` into one atlas file: a small
+    header, a JSON index {poster: [offset, mtime_ns]}, then the raw RGB pixels
+    of every thumbnail back to back. Missing or unreadable posters are skipped.
+    With `canonical` (PosterManifest.canonical) duplicate posters share one
+    thumbnail. Returns the number of thumbnails written.
+    """
+    size = (int(size[0]), int(size[1]))
+    nbytes = size[0] * size[1] * 3
+    blobs, entries = [], {}
+    for path in dict.fromkeys(paths):        # unique, order kept
+        key = _key(path)
+        if not path or key in entries:
+            continue
+        source = canonical(path) if canonical else path
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+            shared = entries.get(_key(source))
+            if shared is None:
+                offset = len(blobs) * nbytes
+                blobs.append(decode_poster(source, size).tobytes())
+                if source != path:
+                    entries[_key(source)] = [offset, os.stat(source).st_mtime_ns]
+            else:
+                offset = shared[0]
+        except Exception as e:
+            print("Skipping poster for atlas:", path, e)
+            continue
+        entries[key] = [offset, mtime_ns]
+
+    index = {"size": list(size), "mode": "RGB", "entries": entries}
+    index_bytes = json.dumps(index).encode("utf-8")
+    data_offset = -(-(_HEADER.size + len(index_bytes)) // _ALIGN) * _ALIGN
+    tmp = f"{out}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, len(index_bytes)))
+        f.write(index_bytes)
+        f.write(b"\0" * (data_offset - _HEADER.size - len(index_bytes)))
+        for pixels in blobs:
+            f.write(pixels)
+    os.replace(tmp, out)
+    return len(blobs)
+
+
+def atlas_is_current(paths, out=ATLAS_FILE, size=ATLAS_SIZE):
+    """True when `out` holds every poster in `paths` at `size`, all built from their current files."""
+    atlas = PosterAtlas.open(out, validate=False)
+    if atlas is None or atlas.size != tuple(size):
+        return False
+    try:
+        for path in paths:
+            if not path or not os.path.exists(path):
+                continue
+            entry = atlas.entries.get(_key(path))
+            if entry is None or entry[1] != os.stat(path).st_mtime_ns:
+                return False
+        return True
+    finally:
+        atlas.close()
+
+
+class PosterAtlas:
+    """
+    Read side of the atlas: the file is memory-mapped once and `get()` wraps a
+    slice of the mapping as a PIL image (Image.frombuffer, no copy, no file
+    open per poster). The OS pages thumbnails in on first touch.
+
+    Entries are only served once `validate()` has checked them against the
+    mtimes of the poster files (open() runs it on a background thread); entries
+    whose poster changed or disappeared are dropped, so the app falls back to
+    the thumbnail cache for them until the atlas is rebuilt.
+    """
+
+    def __init__(self, path=ATLAS_FILE):
+        self.path = path
+        with open(path, "rb") as f:
+            magic, index_len = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != _MAGIC:
+                raise ValueError(f"{path} is not a poster atlas")
+            index = json.loads(f.read(index_len).decode("utf-8"))
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.size = tuple(index["size"])
+        self.entries = {}                 # served entries: filled by validate()
+        self._unchecked = index["entries"]
+        self.stale = 0
+        self._data_offset = -(-(_HEADER.size + index_len) // _ALIGN) * _ALIGN
+        self._nbytes = self.size[0] * self.size[1] * 3
+        self._view = memoryview(self._mmap)
+
+    @classmethod
+    def open(cls, path=ATLAS_FILE, validate=True):
+        """
+        The atlas at `path`, or None when there is none (or it is unreadable).
+        With `validate` its entries are checked on a background thread and
+        served once that is done; otherwise they are served as recorded.
+        """
+        if not os.path.exists(path):
+            return None
+        try:
+            atlas = cls(path)
+        except Exception as e:
+            print("Ignoring poster atlas:", e)
+            return None
+        if validate:
+            threading.Thread(target=atlas.validate, daemon=True).start()
+        else:
+            atlas.entries = atlas._unchecked
+        return atlas
+
+    def validate(self):
+        """Keep only the entries whose poster still has the recorded mtime (one stat per poster)."""
+        current = {}
+        for key, entry in self._unchecked.items():
+            try:
+                if os.stat(key).st_mtime_ns == entry[1]:
+                    current[key] = entry
+            except OSError:
+                pass
+        self.stale = len(self._unchecked) - len(current)
+        if self.stale:
+            print(f"Poster atlas: {self.stale} posters changed since it was built (python poster_atlas.py rebuilds it)")
+        self.entries = current    # one assignment: get() on the Tk thread sees all or nothing
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, path):
+        return _key(path) in self.entries
+
+    def get(self, path, size=None):
+        """Thumbnail of `path` (read-only image over the mapping), or None if it is not in the atlas."""
+        if size is not None and tuple(size) != self.size:
+            return None
+        entry = self.entries.get(_key(path))
+        if entry is None:
+            return None
+        start = self._data_offset + entry[0]
+        return Image.frombuffer("RGB", self.size, self._view[start:start + self._nbytes], "raw", "RGB", 0, 1)
+
+    def close(self):
+        """Only safe once no image returned by get() is alive (they point into the mapping)."""
+        self._view.release()
+        self._mmap.close()
+
+
+if __name__ == "__main__":
+    import sys
+    from catalog import iter_catalog
+    from poster_manifest import PosterManifest
+
+    source = sys.argv[1] if len(sys.argv) > 1 else "data.json"
+    posters = [item.poster for item in iter_catalog(source)]
+    manifest = PosterManifest()
+    manifest.refresh(posters)
+    if atlas_is_current(posters):
+        print("Poster atlas is up to date")
+    else:
+        n = build_atlas(posters, canonical=manifest.canonical)
+        print("Packed %d unique posters into %s" % (n, ATLAS_FILE))
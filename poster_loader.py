@@ -0,0 +1,85 @@
+# poster_loader.py
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import queue
+
+from thumbcache import load_thumbnail
+
+
+class PosterLoader:
+    """
+    Decode and resize posters on a small thread pool.
+    Only PIL work runs on the workers; finished images are handed back to the
+    Tk thread (polled with `after`) where `callback(pil_image)` is called.
+    `cancel_all()` drops every pending request, e.g. when the view changes;
+    `cancel_group(group)` drops only the requests tagged with `group`.
+    """
+
+    def __init__(self, root, workers=4, poll_ms=25):
+        self.root = root
+        self.poll_ms = poll_ms
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="poster")
+        self._done = queue.Queue()
+        self._pending = {}            # token -> (future, callback, group)
+        self._tokens = itertools.count()
+        self._poll_id = None
+
+    def request(self, path, size, callback, group=None):
+        """Queue a decode of `path` at `size`. `callback(img)` gets None if decoding failed."""
+        token = next(self._tokens)
+        future = self._pool.submit(load_thumbnail, path, size)
+        self._pending[token] = (future, callback, group)
+        future.add_done_callback(lambda f, t=token: self._done.put(t))
+        if self._poll_id is None:
+            self._poll_id = self.root.after(self.poll_ms, self._poll)
+        return token
+
+    def cancel(self, token):
+        entry = self._pending.pop(token, None)
+        if entry:
+            entry[0].cancel()
+
+    def cancel_group(self, group):
+        for token in [t for t, entry in self._pending.items() if entry[2] is group]:
+            self.cancel(token)
+
+    def cancel_all(self):
+        for future, _, _ in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+
+    def pending(self):
+        return len(self._pending)
+
+    def shutdown(self):
+        self.cancel_all()
+        if self._poll_id is not None:
+            try:
+                self.root.after_cancel(self._poll_id)
+            except Exception:
+                pass
+            self._poll_id = None
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    # ----------------- Tk thread side -----------------
+    def _poll(self):
+        self._poll_id = None
+        while True:
+            try:
+                token = self._done.get_nowait()
+            except queue.Empty:
+                break
+            entry = self._pending.pop(token, None)
+            if entry is None:
+                continue  # cancelled while decoding
+            future, callback, _ = entry
+            try:
+                img = future.result()
+            except Exception:
+                img = None
+            try:
+                callback(img)
+            except Exception as e:
+                print("Poster callback failed:", e)
+        if self._pending:
+            self._poll_id = self.root.after(self.poll_ms, self._poll)
@@ -0,0 +1,129 @@
+# poster_manifest.py
+import hashlib
+import json
+import os
+import threading
+
+# Manifest file (next to data.json): poster path -> size, mtime and content hash
+MANIFEST_FILE = ".posters.manifest.json"
+
+
+def _file_digest(path):
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+class PosterManifest:
+    """
+    Content-hash map of the poster files. Byte-identical posters (e.g. the same
+    key art saved under two titles) resolve to one canonical path, so decoding,
+    the thumbnail cache, the atlas and the in-memory image cache all work once
+    per unique image instead of once per path.
+
+    Files are hashed once and remembered by (size, mtime), so `refresh()` only
+    re-reads new or changed posters. `canonical()` does no I/O: paths the
+    manifest has not seen yet resolve to themselves.
+    """
+
+    def __init__(self, path=MANIFEST_FILE):
+        self.path = path
+        self._files = {}        # poster path -> [size, mtime_ns, sha1]
+        self._canonical = {}    # poster path -> canonical path (only for duplicates)
+        self.hits = {"image cache": 0, "thumbnail": 0}   # lookups served only thanks to canonicalization
+        self._lock = threading.Lock()
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self._files = json.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print("Ignoring unreadable poster manifest:", e)
+        self._rebuild()
+
+    def _rebuild(self):
+        by_hash = {}
+        for p in sorted(self._files):
+            by_hash.setdefault(self._files[p][2], []).append(p)
+        # swapped in one assignment: canonical() may run on the Tk thread meanwhile
+        self._canonical = {p: group[0] for group in by_hash.values() if len(group) > 1 for p in group[1:]}
+
+    def refresh(self, paths, save=True):
+        """Hash new or changed posters among `paths` (stat per file, read only when changed)."""
+        with self._lock:
+            files = dict(self._files)
+            changed = False
+            for p in dict.fromkeys(paths):
+                if not p:
+                    continue
+                try:
+                    st = os.stat(p)
+                except OSError:
+                    changed |= files.pop(p, None) is not None
+                    continue
+                entry = files.get(p)
+                if entry is None or entry[0] != st.st_size or entry[1] != st.st_mtime_ns:
+                    try:
+                        files[p] = [st.st_size, st.st_mtime_ns, _file_digest(p)]
+                        changed = True
+                    except OSError:
+                        continue
+            if not changed:
+                return False
+            self._files = files
+            self._rebuild()
+            if save:
+                self.save()
+            return True
+
+    def save(self):
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._files, f)
+            os.replace(tmp, self.path)
+        except Exception as e:
+            print("Could not write poster manifest:", e)
+
+    def canonical(self, path):
+        """The path decoding / caching should use for `path`."""
+        return self._canonical.get(path, path)
+
+    def record_hit(self, kind):
+        """Count a lookup for a duplicate that was served from the canonical poster's `kind` cache."""
+        self.hits[kind] += 1
+
+    def stats(self):
+        """Totals for the report: files, unique images, duplicate files / bytes, decodes saved this session."""
+        files = self._files
+        unique = {entry[2] for entry in files.values()}
+        dup_bytes = sum(files[p][0] for p in self._canonical if p in files)
+        return {
+            "files": len(files),
+            "unique": len(unique),
+            "duplicates": len(self._canonical),
+            "duplicate_bytes": dup_bytes,
+            "decodes_saved": sum(self.hits.values()),
+            "hits": dict(self.hits),
+        }
+
+    def report(self):
+        s = self.stats()
+        return (f"{s['files']} posters, {s['unique']} unique images: {s['duplicates']} duplicates "
+                f"({s['duplicate_bytes'] / 1024:.0f} KB) deduplicated, "
+                f"{s['decodes_saved']} decodes saved this session "
+                f"({s['hits']['image cache']} image cache / {s['hits']['thumbnail']} thumbnail hits)")
+
+
+if __name__ == "__main__":
+    import sys
+    from catalog import iter_catalog
+
+    source = sys.argv[1] if len(sys.argv) > 1 else "data.json"
+    manifest = PosterManifest()
+    manifest.refresh(item.poster for item in iter_catalog(source))
+    for alias, canon in sorted(manifest._canonical.items()):
+        print(f"  {alias} -> {canon}")
+    print(manifest.report())
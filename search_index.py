@@ -0,0 +1,284 @@
+# search_index.py
+from array import array
+from collections import Counter, OrderedDict, defaultdict
+import heapq
+
+from catalog import fold
+
+
+def normalize(text):
+    """Normalization used for both indexed text and queries: casefolded, accents stripped (see catalog.fold)."""
+    return fold(text)
+
+
+class NgramIndex:
+    """
+    Substring index over short strings (titles).
+    Every 1-, 2- and 3-gram of the normalized text points to the documents that
+    contain it. A query is answered by intersecting the posting lists of its
+    n-grams (smallest first) and, for queries longer than `n`, checking the few
+    candidates with a plain `in` — so results match `normalize(query) in normalize(text)` exactly.
+    Documents are identified by any hashable id (list index, object id...).
+    """
+
+    def __init__(self, n=3):
+        self.n = n
+        self._postings = defaultdict(set)   # gram -> {doc id}
+        self._docs = {}                     # doc id -> normalized text
+        self.version = 0                    # bumped on every change (lets caches notice)
+
+    def __len__(self):
+        return len(self._docs)
+
+    def __contains__(self, doc_id):
+        return doc_id in self._docs
+
+    def _grams(self, text):
+        grams = set()
+        for k in range(1, self.n + 1):
+            for i in range(len(text) - k + 1):
+                grams.add(text[i:i + k])
+        return grams
+
+    def add(self, doc_id, text):
+        if doc_id in self._docs:
+            self.remove(doc_id)
+        text = normalize(text)
+        self.version += 1
+        self._docs[doc_id] = text
+        for gram in self._grams(text):
+            self._postings[gram].add(doc_id)
+
+    def remove(self, doc_id):
+        text = self._docs.pop(doc_id, None)
+        if text is None:
+            return
+        self.version += 1
+        for gram in self._grams(text):
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(doc_id)
+                if not posting:
+                    del self._postings[gram]
+
+    def clear(self):
+        self.version += 1
+        self._postings.clear()
+        self._docs.clear()
+
+    def state(self):
+        """(docs, postings) as plain lists, posting ids packed in arrays; see from_state()."""
+        return list(self._docs.items()), [(gram, array("l", ids)) for gram, ids in self._postings.items()]
+
+    @classmethod
+    def from_state(cls, docs, postings, **options):
+        """
+        Rebuild an index from state(), e.g. out of the catalog snapshot. Both lists
+        unpickle quickly (the snapshot writes `docs` in slices and arrays as raw
+        bytes), instead of one long unpickle of the sets.
+        """
+        index = cls(**options)
+        index._docs = dict(docs)
+        index._postings.update((gram, set(ids)) for gram, ids in postings)
+        return index
+
+    def text(self, doc_id):
+        return self._docs.get(doc_id)
+
+    def search(self, query):
+        """Return the set of doc ids whose normalized text contains `query`."""
+        query = normalize(query)
+        if not query:
+            return set(self._docs)
+        k = min(self.n, len(query))
+        grams = {query[i:i + k] for i in range(len(query) - k + 1)}
+        postings = []
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if not posting:
+                return set()
+            postings.append(posting)
+        postings.sort(key=len)
+        result = set(postings[0])
+        for posting in postings[1:]:
+            result &= posting
+            if not result:
+                return result
+        if len(query) > k:
+            docs = self._docs
+            result = {d for d in result if query in docs[d]}
+        return result
+
+
+class QueryCache:
+    """
+    Recent query -> result cache in front of an NgramIndex (LRU, `max_entries`).
+    Results are tuples of doc ids in ascending order. A query that extends a
+    cached one (e.g. "andh" after "and") is answered by filtering that smaller
+    result set instead of going back to the index. Everything is dropped when
+    the index changes.
+    """
+
+    def __init__(self, index, max_entries=64):
+        self.index = index
+        self.max_entries = max_entries
+        self._results = OrderedDict()   # normalized query -> tuple of ids
+        self._version = index.version
+
+    def clear(self):
+        self._results.clear()
+        self._version = self.index.version
+
+    def search(self, query):
+        if self._version != self.index.version:
+            self.clear()
+        query = normalize(query)
+        cached = self._results.get(query)
+        if cached is not None:
+            self._results.move_to_end(query)
+            return cached
+
+        base = None
+        for k in range(len(query) - 1, 0, -1):
+            base = self._results.get(query[:k])
+            if base is not None:
+                break
+        if base is not None:
+            text = self.index.text
+            result = tuple(d for d in base if query in text(d))
+        else:
+            result = tuple(sorted(self.index.search(query)))
+
+        self._results[query] = result
+        if len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+        return result
+
+
+# ----------------- Fuzzy (typo tolerant) search -----------------
+_VOWELS = set("aeiou")
+
+
+def skeleton(text):
+    """
+    Loose spelling key for transliterated titles: lowercase letters/digits only,
+    doubled letters collapsed and the silent 'h' after a consonant dropped, so
+    "Aashiqui" ~ "Ashiqui", "Andaaz" ~ "andazz", "Bhaijaan" ~ "Baijan".
+    Returns the list of tokens.
+    """
+    tokens = []
+    for raw in normalize(text).split():
+        out = []
+        for ch in raw:
+            if not ch.isalnum():
+                continue
+            ch = {"q": "k", "w": "v", "z": "j"}.get(ch, ch)
+            if out and ch == out[-1]:
+                continue
+            if ch == "h" and out and out[-1].isalpha() and out[-1] not in _VOWELS:
+                continue
+            out.append(ch)
+        if out:
+            tokens.append("".join(out))
+    return tokens
+
+
+def edit_distance(a, b):
+    """Plain Levenshtein distance."""
+    if len(a) < len(b):
+        a, b = b, a
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i]
+        for j, cb in enumerate(b, 1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb)))
+        prev = cur
+    return prev[-1]
+
+
+def _similarity(a, b):
+    if not a or not b:
+        return 0.0
+    return 1.0 - edit_distance(a, b) / max(len(a), len(b))
+
+
+class FuzzyIndex:
+    """
+    Typo tolerant, ranked title search.
+    Candidates come from a trigram index over each title's skeleton (see
+    `skeleton`); only the best `candidates` of them by shared trigrams are
+    re-ranked with edit distance, both on whole titles and token by token.
+    `search()` returns the top-k doc ids, best first.
+    """
+
+    def __init__(self, candidates=50, min_score=0.55):
+        self.candidates = candidates
+        self.min_score = min_score
+        self._postings = defaultdict(set)   # trigram -> {doc id}
+        self._docs = {}                     # doc id -> (tokens, joined skeleton)
+
+    def __len__(self):
+        return len(self._docs)
+
+    @staticmethod
+    def _grams(joined):
+        padded = f"${joined}$"
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+    def add(self, doc_id, text):
+        if doc_id in self._docs:
+            self.remove(doc_id)
+        tokens = skeleton(text)
+        joined = "".join(tokens)
+        self._docs[doc_id] = (tokens, joined)
+        for gram in self._grams(joined):
+            self._postings[gram].add(doc_id)
+
+    def remove(self, doc_id):
+        entry = self._docs.pop(doc_id, None)
+        if entry is None:
+            return
+        for gram in self._grams(entry[1]):
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(doc_id)
+                if not posting:
+                    del self._postings[gram]
+
+    def state(self):
+        """(docs, postings) as plain lists; see NgramIndex.state()."""
+        return list(self._docs.items()), [(gram, array("l", ids)) for gram, ids in self._postings.items()]
+
+    @classmethod
+    def from_state(cls, docs, postings, **options):
+        index = cls(**options)
+        index._docs = dict(docs)
+        index._postings.update((gram, set(ids)) for gram, ids in postings)
+        return index
+
+    def score(self, query_tokens, doc_id):
+        """Similarity in [0, 1] between a skeletonized query and one document."""
+        tokens, joined = self._docs[doc_id]
+        q_joined = "".join(query_tokens)
+        if q_joined in joined:
+            # exact (loose) substring: best possible, shorter titles first
+            return 1.0 + len(q_joined) / (len(joined) * 1000.0)
+        whole = _similarity(q_joined, joined)
+        per_token = sum(max((_similarity(q, t) for t in tokens), default=0.0)
+                        for q in query_tokens) / len(query_tokens)
+        return max(whole, per_token)
+
+    def search(self, query, k=30):
+        query_tokens = skeleton(query)
+        if not query_tokens:
+            return ()
+        hits = Counter()
+        for gram in self._grams("".join(query_tokens)):
+            for doc_id in self._postings.get(gram, ()):
+                hits[doc_id] += 1
+        ranked = []
+        for doc_id, _ in hits.most_common(self.candidates):
+            s = self.score(query_tokens, doc_id)
+            if s >= self.min_score:
+                ranked.append((s, doc_id))
+        return tuple(doc_id for _, doc_id in heapq.nlargest(k, ranked, key=lambda r: r[0]))
@@ -0,0 +1,95 @@
+# snapshot.py
+import hashlib
+import os
+import pickle
+
+# Bump when the pickled layout (CatalogItem slots, index state) or item normalization changes
+SNAPSHOT_VERSION = 5
+
+# List values are pickled in slices of this many entries: each pickle call holds
+# the GIL, so a load or save on a worker thread only stalls the UI for one slice
+SLICE_ITEMS = 2000
+
+
+def snapshot_path(source):
+    """Snapshot file for `source`, e.g. data.json -> .data.json.snapshot (same folder)."""
+    folder, name = os.path.split(source)
+    return os.path.join(folder, f".{name}.snapshot")
+
+
+def file_digest(path):
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def file_stat(path):
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def load(source, path=None):
+    """
+    Return the payload (dict) saved for `source`, or None when there is no
+    snapshot or it is stale. A snapshot is valid when the source has the
+    recorded size and either the same mtime or (touched but unchanged) the
+    same SHA-1.
+    """
+    path = path or snapshot_path(source)
+    try:
+        with open(path, "rb") as f:
+            header = pickle.load(f)
+            if header.get("version") != SNAPSHOT_VERSION:
+                return None
+            mtime_ns, size, digest = header["source"]
+            if file_stat(source) != (mtime_ns, size):
+                if os.path.getsize(source) != size or file_digest(source) != digest:
+                    return None
+            payload = {}
+            while True:
+                record = pickle.load(f)
+                if record is None:
+                    return payload
+                key, value = record
+                if isinstance(value, list) and key in payload:
+                    payload[key].extend(value)
+                else:
+                    payload[key] = value
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print("Ignoring unreadable catalog snapshot:", e)
+        return None
+
+
+def save(source, payload, stat, path=None):
+    """
+    Write `payload` (a dict) as the snapshot of `source`. `stat` is
+    file_stat(source) taken before the source was parsed; if the file changed
+    since, nothing is written (the payload would describe an older version).
+    Meant to run on a background thread: the header and payload go to a temp
+    file that replaces the old snapshot only once complete.
+    """
+    path = path or snapshot_path(source)
+    try:
+        digest = file_digest(source)
+        if file_stat(source) != stat:
+            return False
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            header = {"version": SNAPSHOT_VERSION, "source": (stat[0], stat[1], digest)}
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            for key, value in payload.items():
+                if isinstance(value, list):
+                    for start in range(0, max(len(value), 1), SLICE_ITEMS):
+                        pickle.dump((key, value[start:start + SLICE_ITEMS]), f, protocol=pickle.HIGHEST_PROTOCOL)
+                else:
+                    pickle.dump((key, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(None, f)   # end of payload
+        os.replace(tmp, path)
+        return True
+    except Exception as e:
+        print("Could not write catalog snapshot:", e)
+        return False
@@ -0,0 +1,359 @@
+# store.py
+import json
+import os
+import sqlite3
+
+from facets import genre_values, language_values, number_value, title_key, type_values
+
+# Default database file, next to data.json / movies.json
+DB_FILE = "catalog.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id          INTEGER PRIMARY KEY,
+    title       TEXT NOT NULL,
+    title_key   TEXT NOT NULL,
+    type        TEXT NOT NULL,
+    year        REAL,
+    rating      REAL,
+    data        TEXT NOT NULL          -- the original item as JSON
+);
+CREATE INDEX IF NOT EXISTS items_type   ON items(type);
+CREATE INDEX IF NOT EXISTS items_year   ON items(year);
+CREATE INDEX IF NOT EXISTS items_rating ON items(rating);
+CREATE INDEX IF NOT EXISTS items_title  ON items(title_key);
+
+CREATE TABLE IF NOT EXISTS item_languages (
+    item_id  INTEGER NOT NULL REFERENCES items(id) ON DELETE CASCADE,
+    language TEXT NOT NULL,
+    PRIMARY KEY (language, item_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS item_genres (
+    item_id INTEGER NOT NULL REFERENCES items(id) ON DELETE CASCADE,
+    genre   TEXT NOT NULL,
+    PRIMARY KEY (genre, item_id)
+) WITHOUT ROWID;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(
+    title, genres, description, tokenize = 'unicode61 remove_diacritics 2'
+);
+
+CREATE TABLE IF NOT EXISTS watchlist (
+    id       INTEGER PRIMARY KEY,
+    title    TEXT NOT NULL,
+    category TEXT NOT NULL DEFAULT '',
+    watched  INTEGER NOT NULL DEFAULT 0,
+    item_id  INTEGER REFERENCES items(id) ON DELETE SET NULL
+);
+CREATE INDEX IF NOT EXISTS watchlist_item ON watchlist(item_id);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Sort orders accepted by CatalogStore.filter (NULLs always last)
+ORDERS = {"rating": "rating", "year": "year", "title": "title_key", None: "id"}
+
+
+def fts_query(text):
+    """Turn free text into an FTS5 query: every word must match as a prefix ("andh" -> "andh"*)."""
+    words = "".join(ch if ch.isalnum() else " " for ch in str(text)).split()
+    return " ".join(f'"{w}"*' for w in words)
+
+
+class CatalogStore:
+    """
+    Optional SQLite backend for the catalog and the watchlist.
+
+    Items keep their original JSON in `items.data`; the fields the UI filters and
+    sorts on are copied into indexed columns (type, year, rating, title) and into
+    the item_languages / item_genres tables, and title + genres + description go
+    into an FTS5 table. Filters, sorts and searches are SQL queries that return
+    only the requested page, so the catalog never has to be held in memory.
+
+        store = CatalogStore("catalog.db")
+        store.filter(type="movie", genre="Drama", year=(2010, None), order="rating", reverse=True, limit=50)
+        store.search("andhadhun")
+    """
+
+    def __init__(self, path=DB_FILE):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ----------------- Meta -----------------
+    def get_meta(self, key, default=None):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return default if row is None else row[0]
+
+    def set_meta(self, key, value):
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value)))
+
+    # ----------------- Catalog items -----------------
+    def _insert_item(self, item):
+        if hasattr(item, "to_dict"):
+            item = item.to_dict()   # CatalogItem record
+        genres = genre_values(item)
+        cur = self.conn.execute(
+            "INSERT INTO items (title, title_key, type, year, rating, data) VALUES (?, ?, ?, ?, ?, ?)",
+            (str(item.get("title", "")), title_key(item), type_values(item)[0],
+             number_value("year")(item), number_value("rating")(item), json.dumps(item, ensure_ascii=False)))
+        item_id = cur.lastrowid
+        self.conn.executemany("INSERT OR IGNORE INTO item_languages (item_id, language) VALUES (?, ?)",
+                              [(item_id, l) for l in language_values(item)])
+        self.conn.executemany("INSERT OR IGNORE INTO item_genres (item_id, genre) VALUES (?, ?)",
+                              [(item_id, g) for g in genres])
+        self.conn.execute("INSERT INTO items_fts (rowid, title, genres, description) VALUES (?, ?, ?, ?)",
+                          (item_id, str(item.get("title", "")), " ".join(genres), str(item.get("description", ""))))
+        return item_id
+
+    def add_item(self, item):
+        with self.conn:
+            return self._insert_item(item)
+
+    def add_items(self, items):
+        """Insert many items in one transaction. Returns how many were added."""
+        n = 0
+        with self.conn:
+            for item in items:
+                self._insert_item(item)
+                n += 1
+        return n
+
+    def replace_items(self, items):
+        """
+        Swap the whole catalog for `items` in one transaction. Watchlist entries
+        are re-linked to the new rows by title. Returns how many items were added.
+        """
+        n = 0
+        with self.conn:
+            self.conn.execute("DELETE FROM items_fts")
+            self.conn.execute("DELETE FROM items")    # languages / genres cascade, watchlist links go NULL
+            for item in items:
+                self._insert_item(item)
+                n += 1
+            by_title = {row[1]: row[0] for row in self.conn.execute("SELECT id, title_key FROM items")}
+            for row in self.conn.execute("SELECT id, title FROM watchlist").fetchall():
+                self.conn.execute("UPDATE watchlist SET item_id = ? WHERE id = ?",
+                                  (by_title.get(title_key({"title": row[1]})), row[0]))
+        return n
+
+    def remove_item(self, item_id):
+        with self.conn:
+            self.conn.execute("DELETE FROM items_fts WHERE rowid = ?", (item_id,))
+            self.conn.execute("DELETE FROM items WHERE id = ?", (item_id,))
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+    def get(self, item_id):
+        row = self.conn.execute("SELECT data FROM items WHERE id = ?", (item_id,)).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def items(self, ids):
+        """Items for `ids`, in the same order (missing ids are skipped)."""
+        ids = list(ids)
+        found = {}
+        for start in range(0, len(ids), 500):   # stay under SQLite's bound-parameter limit
+            chunk = ids[start:start + 500]
+            marks = ",".join("?" * len(chunk))
+            for row in self.conn.execute(f"SELECT id, data FROM items WHERE id IN ({marks})", chunk):
+                found[row[0]] = json.loads(row[1])
+        return [found[i] for i in ids if i in found]
+
+    def iter_items(self, batch=1000):
+        """Every item in insertion order, fetched `batch` rows at a time."""
+        cur = self.conn.execute("SELECT data FROM items ORDER BY id")
+        while True:
+            rows = cur.fetchmany(batch)
+            if not rows:
+                break
+            for row in rows:
+                yield json.loads(row[0])
+
+    @staticmethod
+    def _where(type=None, genre=None, language=None, year=None, rating=None):
+        """SQL WHERE clause + parameters for the same criteria as FacetIndex.filter."""
+        clauses, params = [], []
+        if type is not None:
+            clauses.append("items.type = ?")
+            params.append(type)
+        for table, column, value in (("item_genres", "genre", genre), ("item_languages", "language", language)):
+            if value is None:
+                continue
+            values = list(value) if isinstance(value, (list, tuple, set)) else [value]
+            marks = ",".join("?" * len(values))
+            clauses.append(f"items.id IN (SELECT item_id FROM {table} WHERE {column} IN ({marks}))")
+            params += values
+        for column, bounds in (("year", year), ("rating", rating)):
+            if bounds is None:
+                continue
+            lo, hi = bounds
+            if lo is not None:
+                clauses.append(f"items.{column} >= ?")
+                params.append(lo)
+            if hi is not None:
+                clauses.append(f"items.{column} <= ?")
+                params.append(hi)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def filter_ids(self, order=None, reverse=False, limit=None, offset=0, **criteria):
+        """
+        Ids of items matching `criteria` (type / genre / language values, year /
+        rating (lo, hi) ranges), sorted by `order` ("rating", "year", "title" or
+        None for catalog order) and cut to one page.
+        """
+        where, params = self._where(**criteria)
+        column = ORDERS[order]
+        sql = (f"SELECT id FROM items{where} "
+               f"ORDER BY {column} IS NULL, {column} {'DESC' if reverse else 'ASC'}, id")
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            params += [-1 if limit is None else limit, offset]
+        return [row[0] for row in self.conn.execute(sql, params)]
+
+    def filter(self, order=None, reverse=False, limit=None, offset=0, **criteria):
+        return self.items(self.filter_ids(order, reverse, limit, offset, **criteria))
+
+    def count_matching(self, **criteria):
+        where, params = self._where(**criteria)
+        return self.conn.execute(f"SELECT COUNT(*) FROM items{where}", params).fetchone()[0]
+
+    def counts(self, facet, **criteria):
+        """{genre or language: number of matching items}, like FacetIndex.counts."""
+        table, column = {"genre": ("item_genres", "genre"), "language": ("item_languages", "language")}[facet]
+        where, params = self._where(**criteria)
+        sql = (f"SELECT f.{column}, COUNT(*) FROM {table} f JOIN items ON items.id = f.item_id{where} "
+               f"GROUP BY f.{column}")
+        return {value: n for value, n in self.conn.execute(sql, params)}
+
+    def values(self, facet):
+        table, column = {"genre": ("item_genres", "genre"), "language": ("item_languages", "language")}[facet]
+        return [row[0] for row in self.conn.execute(f"SELECT DISTINCT {column} FROM {table} ORDER BY {column}")]
+
+    def search_ids(self, query, limit=100, **criteria):
+        """Full-text search over title, genres and description (best matches first)."""
+        match = fts_query(query)
+        if not match:
+            return []
+        where, params = self._where(**criteria)
+        where = where.replace(" WHERE ", " AND ", 1)
+        # title hits weigh more than genre / description hits
+        sql = (f"SELECT items.id FROM items_fts JOIN items ON items.id = items_fts.rowid "
+               f"WHERE items_fts MATCH ?{where} ORDER BY bm25(items_fts, 10.0, 2.0, 1.0) LIMIT ?")
+        return [row[0] for row in self.conn.execute(sql, [match] + params + [limit])]
+
+    def search(self, query, limit=100, **criteria):
+        return self.items(self.search_ids(query, limit, **criteria))
+
+    # ----------------- Watchlist -----------------
+    def watchlist(self, watched=None):
+        """Watchlist rows as dicts (id, title, category, watched, item_id), oldest first."""
+        sql = "SELECT id, title, category, watched, item_id FROM watchlist"
+        params = []
+        if watched is not None:
+            sql += " WHERE watched = ?"
+            params.append(int(bool(watched)))
+        rows = self.conn.execute(sql + " ORDER BY id", params)
+        return [dict(row, watched=bool(row["watched"])) for row in rows]
+
+    def add_to_watchlist(self, title, category="", watched=False, item_id=None):
+        with self.conn:
+            cur = self.conn.execute(
+                "INSERT INTO watchlist (title, category, watched, item_id) VALUES (?, ?, ?, ?)",
+                (title, category, int(bool(watched)), item_id))
+            return cur.lastrowid
+
+    def remove_from_watchlist(self, entry_id):
+        with self.conn:
+            self.conn.execute("DELETE FROM watchlist WHERE id = ?", (entry_id,))
+
+    def set_watched(self, entry_id, watched=True):
+        with self.conn:
+            self.conn.execute("UPDATE watchlist SET watched = ? WHERE id = ?", (int(bool(watched)), entry_id))
+
+
+# ----------------- One-shot migration from the JSON files -----------------
+def catalog_items(data):
+    """Items from data.json, which is either a list or {"movies": [...], "series": [...]}."""
+    if isinstance(data, list):
+        return data
+    items = []
+    if isinstance(data, dict):
+        for t in ("movies", "series"):
+            for entry in data.get(t, []):
+                item = dict(entry)
+                item.setdefault("type", "movie" if t == "movies" else "web series")
+                items.append(item)
+    return items
+
+
+def _source_stamp(path):
+    st = os.stat(path)
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def _read_catalog(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return catalog_items(json.load(f))
+
+
+def sync_catalog(db_path=DB_FILE, catalog_path="data.json"):
+    """
+    Re-import `catalog_path` into an existing store if the file changed since
+    it was last imported (data.json stays the source of the catalog).
+    Returns the number of items re-imported, 0 when the store was current.
+    """
+    if not os.path.exists(db_path) or not os.path.exists(catalog_path):
+        return 0
+    stamp = _source_stamp(catalog_path)
+    with CatalogStore(db_path) as store:
+        if store.get_meta("catalog_source") == stamp:
+            return 0
+        print(f"{catalog_path} changed since it was imported into {db_path}, re-importing it")
+        n = store.replace_items(_read_catalog(catalog_path))
+        store.set_meta("catalog_source", stamp)
+        return n
+
+
+def migrate(db_path=DB_FILE, catalog_path="data.json"):
+    """
+    Import data.json into `db_path`, or re-import it if it changed since the
+    last run (see sync_catalog). Returns the number of items imported.
+
+    The watchlist is not copied: main.py keeps it in movies.json and its
+    journal, so a copy here would go stale with the first click. The
+    watchlist tables are for callers that write through CatalogStore.
+    """
+    with CatalogStore(db_path) as store:
+        if store.get_meta("migrated"):
+            # earlier versions copied movies.json in once; that copy is stale by now
+            with store.conn:
+                store.conn.execute("DELETE FROM watchlist")
+                store.conn.execute("DELETE FROM meta WHERE key = 'migrated'")
+        if os.path.exists(catalog_path) and store.get_meta("catalog_source") is None:
+            n = store.add_items(_read_catalog(catalog_path))
+            store.set_meta("catalog_source", _source_stamp(catalog_path))
+            return n
+    return sync_catalog(db_path, catalog_path)
+
+
+if __name__ == "__main__":
+    import sys
+    print("Imported %d catalog items" % migrate(*sys.argv[1:3]))
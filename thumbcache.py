@@ -0,0 +1,156 @@
+# thumbcache.py
+from PIL import Image
+import hashlib
+import os
+import shutil
+import threading
+
+import perf
+
+# Folder (next to data.json) that holds the pre-resized poster variants
+THUMB_DIR = ".thumbcache"
+
+# Resampling policies: name -> (reduced-scale JPEG decode first, final resample filter)
+RESAMPLE_POLICIES = {
+    "fast": (True, Image.BILINEAR),
+    "balanced": (True, Image.BICUBIC),
+    "quality": (False, Image.LANCZOS),
+}
+RESAMPLE_POLICY = "balanced"
+
+
+def set_resample_policy(name):
+    """Pick the quality/speed trade-off for new thumbnails (cached ones are rebuilt on next use)."""
+    global RESAMPLE_POLICY
+    if name not in RESAMPLE_POLICIES:
+        raise ValueError(f"Unknown resample policy: {name!r}")
+    RESAMPLE_POLICY = name
+
+
+# ----------------- Cache keys -----------------
+def _path_digest(path):
+    """Short stable digest of the absolute poster path (names the poster's cache folder)."""
+    return hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()[:20]
+
+
+def thumb_path(path, size, mtime_ns=None, policy=None):
+    """
+    Return the cache file name for `path` resized to `size` (w, h) at `mtime_ns`
+    with `policy`. Every variant of one poster lives in its own folder,
+    THUMB_DIR/<path digest>/, so cleaning up after a change only lists that folder.
+    """
+    if mtime_ns is None:
+        mtime_ns = os.stat(path).st_mtime_ns
+    w, h = size
+    return os.path.join(THUMB_DIR, _path_digest(path), f"{w}x{h}_{mtime_ns}_{policy or RESAMPLE_POLICY}.jpg")
+
+
+def _drop_stale(size, keep):
+    """Remove the other variants at `size` in the folder of `keep` (older mtime or another policy)."""
+    w, h = size
+    folder = os.path.dirname(keep)
+    prefix = f"{w}x{h}_"
+    try:
+        for name in os.listdir(folder):
+            full = os.path.join(folder, name)
+            if name.startswith(prefix) and full != keep and not name.endswith(".tmp"):
+                try:
+                    os.remove(full)
+                except OSError:
+                    pass
+    except OSError:
+        pass
+
+
+# ----------------- Decoding -----------------
+@perf.timed("poster decode")
+def decode_poster(path, size, policy=None):
+    """
+    Decode `path` straight to an RGB image of `size`, without the disk cache.
+    With a draft policy the JPEG decoder is first asked for a reduced-scale
+    decode (DCT scaling to 1/2, 1/4 or 1/8, never below `size`), so a 1200px
+    poster shown at 160x250 decodes about 1/16 of the pixels before the final
+    resample.
+    """
+    draft, resample = RESAMPLE_POLICIES[policy or RESAMPLE_POLICY]
+    img = Image.open(path)
+    if draft:
+        img.draft("RGB", size)   # no-op for non-JPEG files
+    return img.convert("RGB").resize(size, resample)
+
+
+# ----------------- Public API -----------------
+def has_thumbnail(path, size):
+    """True when the disk cache already holds `path` at `size` for its current mtime."""
+    try:
+        return os.path.exists(thumb_path(path, (int(size[0]), int(size[1]))))
+    except OSError:
+        return False
+
+
+
+@perf.timed("poster load")
+def load_thumbnail(path, size):
+    """
+    Return a PIL image of `path` resized to `size`.
+    A pre-resized copy is kept in THUMB_DIR, keyed by source path, mtime and size,
+    so a warm start only decodes the small thumbnail instead of the full JPEG.
+    Entries written for an older mtime are removed when the source changes.
+    """
+    size = (int(size[0]), int(size[1]))
+    try:
+        cached = thumb_path(path, size)
+    except OSError:
+        # source missing: let PIL raise the usual error
+        return decode_poster(path, size)
+
+    if os.path.exists(cached):
+        try:
+            img = Image.open(cached)
+            img.load()
+            return img
+        except Exception:
+            # corrupt entry: fall through and rebuild it
+            pass
+
+    img = decode_poster(path, size)
+    try:
+        os.makedirs(os.path.dirname(cached), exist_ok=True)
+        _drop_stale(size, cached)
+        # unique temp name: worker threads may build the same entry at once
+        tmp = f"{cached}.{os.getpid()}.{threading.get_ident()}.tmp"
+        img.save(tmp, "JPEG", quality=90)
+        os.replace(tmp, cached)
+    except Exception as e:
+        print("Could not write thumbnail cache:", e)
+    return img
+
+
+# ----------------- Login backgrounds -----------------
+_backgrounds = {}   # (path, size) -> scaled PIL image, kept for the whole session
+
+
+def load_background(path, size=None):
+    """
+    Return the background image `path` scaled to `size` (source size when None).
+    Decoded once per size per session, so reopening the login window (logout)
+    reuses it; the scaled copy is also kept in THUMB_DIR like a thumbnail, so
+    later launches skip the full-resolution decode.
+    """
+    key = (path, None if size is None else (int(size[0]), int(size[1])))
+    img = _backgrounds.get(key)
+    if img is None:
+        if size is None:
+            img = Image.open(path)
+            img.load()
+        else:
+            img = load_thumbnail(path, size)
+        _backgrounds[key] = img
+    return img
+
+
+def clear_thumbnails():
+    """Delete every cached thumbnail."""
+    if not os.path.isdir(THUMB_DIR):
+        return
+    shutil.rmtree(THUMB_DIR, ignore_errors=True)
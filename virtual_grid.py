@@ -0,0 +1,145 @@
+# virtual_grid.py
+import math
+
+# Default geometry of one recycled card (pixels)
+CARD_HEIGHT = 540
+HEADER_HEIGHT = 64
+
+
+class VirtualGrid:
+    """
+    Windowed card grid drawn straight onto a tk.Canvas.
+    Only the rows in (or just around) the viewport get a card; a fixed pool of
+    card widgets is re-bound to new items as the canvas scrolls. The
+    scrollregion is still computed from the total item count, so the scrollbar
+    behaves as if every card existed.
+
+    make_card(parent) -> widget       builds one empty, reusable card
+    bind_card(card, item)             fills a card with an item's data
+    make_header(parent, title) -> w   builds a section header (optional)
+
+    Call `refresh()` whenever the canvas scrolls or is resized.
+    """
+
+    def __init__(self, canvas, make_card, bind_card, make_header=None, cols=7,
+                 card_height=CARD_HEIGHT, header_height=HEADER_HEIGHT, pad=8, overscan_rows=1):
+        self.canvas = canvas
+        self.make_card = make_card
+        self.bind_card = bind_card
+        self.make_header = make_header
+        self.cols = cols
+        self.card_height = card_height
+        self.header_height = header_height
+        self.pad = pad
+        self.overscan_rows = overscan_rows
+
+        self.active = False
+        self.total_height = 0
+        self._sections = []   # list of (title, items, y_header, y_rows)
+        self._pool = []       # list of [card, window_id, bound_key]
+        self._headers = []    # list of [label, window_id]
+
+    @property
+    def row_height(self):
+        return self.card_height + 2 * self.pad
+
+    # ----------------- Public API -----------------
+    def show(self, sections):
+        """Display `sections`, a list of (title, items). Scrolls back to the top."""
+        self.active = True
+        self._sections = []
+        y = 0
+        for title, items in sections:
+            y_rows = y + self.header_height if title else y
+            rows = math.ceil(len(items) / self.cols)
+            self._sections.append((title, items, y, y_rows))
+            y = y_rows + rows * self.row_height
+        self.total_height = y
+
+        for slot in self._pool:
+            slot[2] = None   # force a rebind, items may have changed
+        self._place_headers()
+        self.canvas.yview_moveto(0)
+        self.refresh()
+
+    def hide(self):
+        """Hide every pooled widget (the pool itself is kept for the next show)."""
+        self.active = False
+        for slot in self._pool:
+            self.canvas.itemconfigure(slot[1], state="hidden")
+            slot[2] = None
+        for header in self._headers:
+            self.canvas.itemconfigure(header[1], state="hidden")
+
+    def pool_size(self):
+        return len(self._pool)
+
+    def refresh(self, *_):
+        if not self.active:
+            return
+        width = max(self.canvas.winfo_width(), 1)
+        height = max(self.canvas.winfo_height(), 1)
+        col_w = width / self.cols
+        self.canvas.configure(scrollregion=(0, 0, width, self.total_height))
+        for header in self._headers:
+            self.canvas.itemconfigure(header[1], width=width)
+
+        top = self.canvas.canvasy(0)
+        bottom = top + height
+        rh = self.row_height
+
+        wanted = []   # (key, item, x, y)
+        for s_idx, (_, items, _, y_rows) in enumerate(self._sections):
+            n_rows = math.ceil(len(items) / self.cols)
+            if not n_rows:
+                continue
+            first = max(0, int((top - y_rows) // rh) - self.overscan_rows)
+            last = min(n_rows - 1, int((bottom - y_rows) // rh) + self.overscan_rows)
+            for r in range(first, last + 1):
+                for c in range(self.cols):
+                    i = r * self.cols + c
+                    if i >= len(items):
+                        break
+                    wanted.append(((s_idx, i), items[i], c * col_w + self.pad, y_rows + r * rh + self.pad))
+
+        wanted_keys = {w[0] for w in wanted}
+        bound = {slot[2]: slot for slot in self._pool if slot[2] in wanted_keys}
+        free = [slot for slot in self._pool if slot[2] not in wanted_keys]
+
+        for key, item, x, y in wanted:
+            slot = bound.get(key)
+            if slot is None:
+                slot = free.pop() if free else self._new_slot()
+                self.bind_card(slot[0], item)
+                slot[2] = key
+            self.canvas.coords(slot[1], x, y)
+            self.canvas.itemconfigure(slot[1], state="normal",
+                                      width=max(int(col_w - 2 * self.pad), 1), height=self.card_height)
+
+        for slot in free:
+            if slot[2] is not None:
+                self.canvas.itemconfigure(slot[1], state="hidden")
+                slot[2] = None
+
+    # ----------------- Internals -----------------
+    def _new_slot(self):
+        card = self.make_card(self.canvas)
+        window_id = self.canvas.create_window(0, 0, window=card, anchor="nw", state="hidden")
+        slot = [card, window_id, None]
+        self._pool.append(slot)
+        return slot
+
+    def _place_headers(self):
+        for header in self._headers:
+            self.canvas.delete(header[1])
+            header[0].destroy()
+        self._headers = []
+        if self.make_header is None:
+            return
+        for title, _, y_header, _ in self._sections:
+            if not title:
+                continue
+            label = self.make_header(self.canvas, title)
+            window_id = self.canvas.create_window(0, y_header, window=label, anchor="nw",
+                                                  height=self.header_height)
+            self._headers.append([label, window_id])